@@ -1,12 +1,29 @@
 #! python3
+import contextlib
 import datetime
+import hashlib
+import io
+import itertools
+import json
+import multiprocessing
 import os
+import shutil
 import sys
+import tempfile
+import threading
 import time
-from typing import Any, Tuple
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, Iterator, List, Set, Tuple
 
+import httplib2
+import numpy as np
 import pandas as pd
 import PyQt5
+import requests
+import trio
+import trio_websocket
 from googleapiclient.discovery import Resource, build
 from oauth2client.service_account import ServiceAccountCredentials
 from pydrive2.auth import GoogleAuth
@@ -14,12 +31,13 @@ from pydrive2.drive import GoogleDrive
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 from selenium import webdriver
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from xlsxwriter.utility import xl_cell_to_rowcol
 
 if hasattr(QtCore.Qt, "AA_EnableHighDpiScaling"):
     PyQt5.QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
@@ -27,6 +45,1621 @@ if hasattr(QtCore.Qt, "AA_EnableHighDpiScaling"):
 if hasattr(QtCore.Qt, "AA_UseHighDpiPixmaps"):
     PyQt5.QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
 
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+try:
+    import python_calamine
+except ImportError:  # Read reports with pandas.read_excel instead
+    python_calamine = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:  # Parse the reports on every run instead
+    pyarrow = None
+
+
+class DownloadTracker(object):
+    """Class to track Chrome downloads through DevTools download events:
+    Downloads are saved under their GUID in downloadPath and reported through
+    Browser.downloadWillBegin/Browser.downloadProgress, so completion is known
+    the moment Chrome finishes writing the file instead of by polling.
+    Args:
+        browser (obj): Chrome webdriver to track the downloads of.
+        downloadPath (str): Folder Chrome saves the in-progress downloads to.
+        timeout (int): Seconds to wait for each download to complete.
+    """
+
+    def __init__(
+        self, browser: webdriver.Chrome, downloadPath: str, timeout: int = 600
+    ) -> None:
+        self.browser = browser
+        self.downloadPath = downloadPath
+        self.timeout = timeout
+        self.downloads: Dict[str, Dict[str, Any]] = {}
+        self.condition = threading.Condition()
+        self.ready = threading.Event()
+        self.error = None
+        self.trioToken = None
+        self.cancelScope = None
+        self.thread = None
+
+    def __enter__(self) -> "DownloadTracker":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        # Listen to the browser's DevTools websocket on a background thread.
+        debuggerAddress = self.browser.capabilities["goog:chromeOptions"][
+            "debuggerAddress"
+        ]
+        with urllib.request.urlopen(f"http://{debuggerAddress}/json/version") as res:
+            webSocketUrl = json.load(res)["webSocketDebuggerUrl"]
+        self.thread = threading.Thread(
+            target=trio.run, args=(self.listen, webSocketUrl), daemon=True
+        )
+        self.thread.start()
+        self.ready.wait(30)
+        if self.error or not self.ready.is_set():
+            raise WebDriverException(f"Could not track downloads: {self.error}")
+
+    def close(self) -> None:
+        if self.trioToken and self.cancelScope:
+            try:
+                trio.from_thread.run_sync(
+                    self.cancelScope.cancel, trio_token=self.trioToken
+                )
+            except trio.RunFinishedError:
+                pass
+        if self.thread:
+            self.thread.join(5)
+
+    async def listen(self, webSocketUrl: str) -> None:
+        self.trioToken = trio.lowlevel.current_trio_token()
+        try:
+            with trio.CancelScope() as self.cancelScope:
+                async with trio_websocket.open_websocket_url(
+                    webSocketUrl, max_message_size=2**24
+                ) as ws:
+                    await ws.send_message(
+                        json.dumps(
+                            {
+                                "id": 1,
+                                "method": "Browser.setDownloadBehavior",
+                                "params": {
+                                    "behavior": "allowAndName",
+                                    "downloadPath": self.downloadPath,
+                                    "eventsEnabled": True,
+                                },
+                            }
+                        )
+                    )
+                    while True:
+                        self.handleMessage(json.loads(await ws.get_message()))
+        except Exception as error:
+            self.error = error
+        finally:
+            self.ready.set()
+            with self.condition:
+                self.condition.notify_all()
+
+    def handleMessage(self, message: Dict[str, Any]) -> None:
+        if message.get("id") == 1:
+            if "error" in message:
+                self.error = message["error"].get("message")
+            self.ready.set()
+            return
+
+        params = message.get("params", {})
+        with self.condition:
+            if message.get("method") == "Browser.downloadWillBegin":
+                self.downloads[params["guid"]] = {
+                    "frameId": params["frameId"],
+                    "url": params["url"],
+                    "state": "inProgress",
+                    "bytes": 0,
+                    "started": time.perf_counter(),
+                    "finished": None,
+                    "claimed": False,
+                }
+            elif message.get("method") == "Browser.downloadProgress":
+                download = self.downloads.get(params["guid"])
+                if download is None:
+                    return
+                download["state"] = params["state"]
+                download["bytes"] = int(params["receivedBytes"])
+                if params["state"] != "inProgress":
+                    download["finished"] = time.perf_counter()
+            else:
+                return
+            self.condition.notify_all()
+
+    def waitFor(self, frameId: str, reportPath: str) -> Dict[str, Any]:
+        """Function to wait for the next download started by a tab:
+        Args:
+            frameId (str): Window handle of the tab that started the download.
+            reportPath (str): Path to move the completed download to.
+        Returns:
+            dict: Final path, size in bytes and duration in seconds.
+        """
+        deadline = time.perf_counter() + self.timeout
+        with self.condition:
+            while True:
+                guid = next(
+                    (
+                        guid
+                        for guid, download in self.downloads.items()
+                        if download["frameId"] == frameId and not download["claimed"]
+                    ),
+                    None,
+                )
+                download = self.downloads.get(guid, {})
+                if download.get("state") == "completed":
+                    download["claimed"] = True
+                    break
+                if download.get("state") == "canceled":
+                    download["claimed"] = True
+                    raise WebDriverException(f"Download of {download['url']} failed.")
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self.thread.is_alive():
+                    raise TimeoutException(
+                        f"Download for {reportPath} did not complete in time."
+                    )
+                self.condition.wait(remaining)
+
+        os.replace(os.path.join(self.downloadPath, guid), reportPath)
+        return {
+            "path": reportPath,
+            "bytes": download["bytes"],
+            "seconds": download["finished"] - download["started"],
+        }
+
+
+class RunWorkspace(object):
+    """Class to isolate the downloaded reports of one run in a temporary folder:
+    Every run gets a unique folder with one report per center, held by a lock
+    file for as long as the run is going. Folders left behind by runs that no
+    longer hold their lock are removed, so concurrent runs never share or
+    delete each other's files.
+    """
+
+    root = os.path.join(tempfile.gettempdir(), "AutoSchedule")
+
+    def __init__(self) -> None:
+        self.path = ""
+        self.lock = None
+
+    def __enter__(self) -> "RunWorkspace":
+        os.makedirs(self.root, exist_ok=True)
+        # Create and lock the folder under the lock of the root, so that the
+        # removeStale of another run never finds it before it is locked.
+        with open(os.path.join(self.root, ".lock"), "a") as rootLock:
+            self.acquire(rootLock, blocking=True)
+            try:
+                self.removeStale()
+                self.path = tempfile.mkdtemp(prefix="run-", dir=self.root)
+                self.lock = open(os.path.join(self.path, ".lock"), "w")
+                self.acquire(self.lock)
+            finally:
+                self.release(rootLock)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release(self.lock)
+        self.lock.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def reportPath(self, name: str) -> str:
+        # Path of the downloaded Destiny report for a center in this run.
+        return os.path.join(self.path, f"SectionScheduleDailySummary {name}.xls")
+
+    def removeStale(self) -> None:
+        for entry in os.listdir(self.root):
+            path = os.path.join(self.root, entry)
+            if not entry.startswith("run-") or not os.path.isdir(path):
+                continue
+            try:
+                with open(os.path.join(path, ".lock"), "a") as lock:
+                    self.acquire(lock)
+                    self.release(lock)
+            except OSError:
+                continue  # Still in use by another run.
+            shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def acquire(lock: Any, blocking: bool = False) -> None:
+        if os.name == "nt":
+            lock.seek(0)
+            msvcrt.locking(
+                lock.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1
+            )
+        else:
+            fcntl.flock(
+                lock.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB)
+            )
+
+    @staticmethod
+    def release(lock: Any) -> None:
+        if os.name == "nt":
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+class ReportCache(object):
+    """Class to keep downloaded Destiny reports for reuse by later runs:
+    Reports are stored once per content hash and looked up by center and date
+    range. Entries expire after ttl seconds, and the least recently used
+    reports are evicted once the cache grows beyond maxSize bytes.
+    Args:
+        path (str): Folder to keep the cached reports in.
+        ttl (int): Seconds a cached report stays valid.
+        maxSize (int): Maximum total size of the cached reports in bytes.
+    """
+
+    def __init__(self, path: str, ttl: int = 3600, maxSize: int = 256 << 20) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.maxSize = maxSize
+
+    @staticmethod
+    def key(campus: str, building: str, startDate: str, endDate: str) -> str:
+        return hashlib.sha256(
+            "|".join([campus, building, startDate, endDate]).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str, reportPath: str) -> bool:
+        """Function to copy a cached report if there is a valid one:
+        Args:
+            key (str): Cache key of the center and date range.
+            reportPath (str): Path to copy the cached report to.
+        Returns:
+            bool: Whether the report was found in the cache.
+        """
+        with self.openIndex() as index:
+            entry = index.get(key)
+            if entry is None:
+                return False
+            if time.time() - entry["created"] > self.ttl:
+                del index[key]
+                self.removeUnused(index)
+                return False
+            entry["lastUsed"] = time.time()
+            shutil.copyfile(os.path.join(self.path, entry["file"]), reportPath)
+        return True
+
+    def put(self, key: str, reportPath: str) -> str:
+        """Function to add a downloaded report to the cache:
+        Args:
+            key (str): Cache key of the center and date range.
+            reportPath (str): Path of the downloaded report.
+        Returns:
+            str: SHA-256 hash of the report content.
+        """
+        contentHash = self.contentHash(reportPath)
+        with self.openIndex() as index:
+            fileName = f"{contentHash}.xls"
+            if not os.path.exists(os.path.join(self.path, fileName)):
+                shutil.copyfile(reportPath, os.path.join(self.path, fileName))
+            index[key] = {
+                "file": fileName,
+                "sha256": contentHash,
+                "size": os.path.getsize(reportPath),
+                "created": time.time(),
+                "lastUsed": time.time(),
+            }
+            # Evict the least recently used reports beyond the size limit.
+            entries = sorted(index.items(), key=lambda item: item[1]["lastUsed"])
+            while entries and self.size(index) > self.maxSize:
+                del index[entries.pop(0)[0]]
+            self.removeUnused(index)
+        return contentHash
+
+    @staticmethod
+    def contentHash(reportPath: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(reportPath, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 16), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def size(index: Dict[str, Dict[str, Any]]) -> int:
+        files = {entry["file"]: entry["size"] for entry in index.values()}
+        return sum(files.values())
+
+    def removeUnused(self, index: Dict[str, Dict[str, Any]]) -> None:
+        # Delete stored reports that no entry refers to anymore.
+        used = {entry["file"] for entry in index.values()}
+        for fileName in os.listdir(self.path):
+            if fileName.endswith(".xls") and fileName not in used:
+                os.remove(os.path.join(self.path, fileName))
+
+    @contextlib.contextmanager
+    def openIndex(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        # Read and write the index under a lock shared with concurrent runs.
+        os.makedirs(self.path, exist_ok=True)
+        indexPath = os.path.join(self.path, "index.json")
+        with open(os.path.join(self.path, ".lock"), "a") as lock:
+            RunWorkspace.acquire(lock, blocking=True)
+            try:
+                try:
+                    with open(indexPath) as file:
+                        index = json.load(file)
+                except (OSError, ValueError):
+                    index = {}
+                yield index
+                with open(f"{indexPath}.tmp", "w") as file:
+                    json.dump(index, file, indent=2)
+                os.replace(f"{indexPath}.tmp", indexPath)
+            finally:
+                RunWorkspace.release(lock)
+
+
+class ScheduleCache(object):
+    """Class to keep parsed schedules as Arrow IPC files for reuse:
+    Schedules are stored by the content hash of the report they were read
+    from, so reading the same report again memory-maps the parsed columns
+    instead of parsing the workbook. Other tools can open the same files with
+    any Arrow reader, e.g. pandas.read_feather. The least recently used
+    schedules are evicted once the cache grows beyond maxSize bytes. Without
+    pyarrow, nothing is cached.
+    Args:
+        path (str): Folder to keep the parsed schedules in.
+        maxSize (int): Maximum total size of the parsed schedules in bytes.
+    """
+
+    # Bump when ReportReader returns different columns or types.
+    version = 1
+
+    def __init__(self, path: str, maxSize: int = 256 << 20) -> None:
+        self.path = path
+        self.maxSize = maxSize
+
+    def schedulePath(self, contentHash: str) -> str:
+        return os.path.join(self.path, f"{contentHash}-v{self.version}.arrow")
+
+    def get(self, contentHash: str) -> Any:
+        """Function to load a parsed schedule if there is one:
+        Args:
+            contentHash (str): SHA-256 hash of the report content.
+        Returns:
+            DataFrame: Parsed schedule, or None when it is not cached.
+        """
+        schedulePath = self.schedulePath(contentHash)
+        if pyarrow is None or not os.path.exists(schedulePath):
+            return None
+        try:
+            with pyarrow.memory_map(schedulePath) as source:
+                schedule = pyarrow.ipc.open_file(source).read_all().to_pandas()
+        except (OSError, pyarrow.ArrowException):
+            return None
+        os.utime(schedulePath)  # Mark as recently used.
+        # Arrow reads missing text as None, where read_excel gives NaN.
+        return schedule.fillna(float("nan"))
+
+    def put(self, contentHash: str, schedule: pd.DataFrame) -> None:
+        """Function to add a parsed schedule to the cache:
+        Args:
+            contentHash (str): SHA-256 hash of the report content.
+            schedule (DataFrame): Schedule as read by ReportReader.
+        """
+        if pyarrow is None:
+            return
+        try:
+            table = pyarrow.Table.from_pandas(schedule, preserve_index=False)
+        except pyarrow.ArrowException:
+            return  # Columns of mixed types, read the report again next time.
+        os.makedirs(self.path, exist_ok=True)
+        schedulePath = self.schedulePath(contentHash)
+        # Write under a unique name first, so readers never see a partial file.
+        with tempfile.NamedTemporaryFile(dir=self.path, delete=False) as file:
+            with pyarrow.ipc.new_file(file, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(file.name, schedulePath)
+        self.removeUnused()
+
+    def removeUnused(self) -> None:
+        # Evict the least recently used schedules beyond the size limit.
+        entries = sorted(
+            (entry for entry in os.scandir(self.path) if entry.name.endswith(".arrow")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        size = sum(entry.stat().st_size for entry in entries)
+        while entries and size > self.maxSize:
+            entry = entries.pop(0)
+            size -= entry.stat().st_size
+            with contextlib.suppress(OSError):
+                os.remove(entry.path)
+
+
+class DestinySession(object):
+    """Class to keep an authenticated Destiny browser session between runs:
+    The browser uses a dedicated Chrome profile so the CalNet login survives
+    restarts of the application. A warm browser is reused for as long as its
+    session is valid, and the interactive login window only opens once the
+    session has actually expired. Chrome runs one browser per profile, so the
+    profile is locked while in use, and another instance running at the same
+    time uses a throwaway copy of it instead.
+    Args:
+        profilePath (str): Chrome user data folder. Blank for a throwaway profile.
+        downloadPath (str): Default Chrome download folder.
+        headless (bool): Run the browser headless whenever no login is needed.
+        homeUrl (str): Destiny landing page.
+        lean (bool): Skip images, fonts and analytics and stop waiting for a page
+            once its document is ready.
+    """
+
+    # Resources Destiny pages do not need to fill in and submit the report form.
+    blockedUrls = [
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.svg",
+        "*.ico",
+        "*.woff",
+        "*.woff2",
+        "*.ttf",
+        "*.otf",
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*newrelic.com*",
+        "*nr-data.net*",
+    ]
+
+    def __init__(
+        self,
+        profilePath: str = "",
+        downloadPath: str = "",
+        headless: bool = True,
+        homeUrl: str = "https://berkeleysv.destinysolutions.com",
+        lean: bool = True,
+    ) -> None:
+        self.homeUrl = homeUrl
+        self.profilePath = profilePath
+        self.downloadPath = downloadPath
+        self.headless = headless
+        self.lean = lean
+        self.browser = None
+        self.profileLock = None
+        self.profileCopy = ""
+
+    def createBrowser(self, headless: bool) -> webdriver.Chrome:
+        # Set Chrome defaults to automate download
+        service = Service()
+        chrome_options = Options()
+        chrome_options.add_experimental_option(
+            "prefs",
+            {
+                "download.default_directory": self.downloadPath,
+                "download.prompt_for_download": False,
+                "download.directory_upgrade": True,
+                "safebrowsing.endabled": True,
+            },
+        )
+        profilePath = self.browserProfile()
+        if profilePath:
+            chrome_options.add_argument(f"--user-data-dir={profilePath}")
+        if headless:
+            chrome_options.add_argument("--headless=new")
+        if self.lean:
+            chrome_options.page_load_strategy = "eager"
+            for argument in [
+                "--disable-extensions",
+                "--disable-gpu",
+                "--disable-sync",
+                "--disable-background-networking",
+                "--disable-default-apps",
+                "--disable-component-update",
+                "--no-first-run",
+            ]:
+                chrome_options.add_argument(argument)
+        browser = webdriver.Chrome(service=service, options=chrome_options)
+        self.prepareTab(browser)
+        return browser
+
+    def browserProfile(self) -> str:
+        """Function to find the Chrome profile this instance can use:
+        Returns:
+            str: profilePath while this instance holds its lock, else a copy of
+                it in a temporary folder, or "" for a throwaway profile.
+        """
+        if not self.profilePath:
+            return ""
+        if self.profileLock is None and not self.profileCopy:
+            os.makedirs(self.profilePath, exist_ok=True)
+            lock = open(f"{self.profilePath}.lock", "a")
+            try:
+                RunWorkspace.acquire(lock)
+                self.profileLock = lock
+            except OSError:  # Used by another running instance.
+                lock.close()
+                self.profileCopy = tempfile.mkdtemp(prefix="profile-")
+                try:
+                    shutil.copytree(
+                        self.profilePath,
+                        self.profileCopy,
+                        ignore=shutil.ignore_patterns("Singleton*", "*Cache*"),
+                        dirs_exist_ok=True,
+                    )
+                except (OSError, shutil.Error) as error:
+                    print(f"[Warning] Could not copy the browser profile: {error}")
+        return self.profileCopy or self.profilePath
+
+    def prepareTab(self, browser: webdriver.Chrome) -> None:
+        # Block non-essential resources in the current tab.
+        if self.lean:
+            browser.execute_cdp_cmd("Network.enable", {})
+            browser.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": self.blockedUrls}
+            )
+
+    def navigate(self, browser: webdriver.Chrome, url: str) -> None:
+        # Load a page, timing how long the navigation takes.
+        started = time.perf_counter()
+        browser.get(url)
+        print(
+            f"[Info] Loaded {url.split('?')[0]} "
+            f"in {time.perf_counter() - started:.2f} s"
+        )
+
+    def isLoggedIn(self, browser: webdriver.Chrome, timeout: int = 10) -> bool:
+        self.navigate(browser, self.homeUrl)
+        try:
+            WebDriverWait(browser, timeout).until(
+                EC.presence_of_element_located((By.ID, "main-area-body"))
+            )
+        except TimeoutException:
+            return False
+        return True
+
+    def getBrowser(self) -> webdriver.Chrome:
+        """Function to get a browser logged in to Destiny:
+        Returns:
+            obj: Chrome webdriver with a valid Destiny session.
+        """
+        # Reuse the warm browser if its session is still valid.
+        if self.browser is not None:
+            try:
+                if self.isLoggedIn(self.browser):
+                    return self.browser
+            except WebDriverException:
+                pass
+            self.quit()
+
+        # Start from the saved profile, which may still hold a valid session.
+        self.browser = self.createBrowser(self.headless)
+        if self.isLoggedIn(self.browser):
+            return self.browser
+
+        # The session expired. Log in to CalNet in a visible browser.
+        if self.headless:
+            self.browser.quit()
+            self.browser = self.createBrowser(False)
+            self.navigate(self.browser, self.homeUrl)
+        WebDriverWait(self.browser, 3600).until(
+            EC.presence_of_element_located((By.ID, "main-area-body"))
+        )
+        if not self.headless:
+            return self.browser
+
+        # Move the new session over to a headless browser.
+        cookies = self.browser.get_cookies()
+        self.browser.quit()
+        self.browser = self.createBrowser(True)
+        self.navigate(self.browser, self.homeUrl)
+        for cookie in cookies:
+            try:
+                self.browser.add_cookie(cookie)
+            except WebDriverException:
+                pass  # Cookie of another domain, e.g. CalNet.
+        if not self.isLoggedIn(self.browser):
+            raise WebDriverException("Could not reuse the Destiny session headless.")
+        return self.browser
+
+    def reset(self) -> None:
+        # Close the tabs opened by a run, keeping the browser warm for the next.
+        try:
+            handles = self.browser.window_handles
+            for handle in handles[1:]:
+                self.browser.switch_to.window(handle)
+                self.browser.close()
+            self.browser.switch_to.window(handles[0])
+        except WebDriverException:
+            self.quit()
+
+    def quit(self) -> None:
+        if self.browser is not None:
+            try:
+                self.browser.quit()
+            except WebDriverException:
+                pass
+            self.browser = None
+        # Let other instances use the profile, and remove the copy.
+        if self.profileLock is not None:
+            RunWorkspace.release(self.profileLock)
+            self.profileLock.close()
+            self.profileLock = None
+        if self.profileCopy:
+            shutil.rmtree(self.profileCopy, ignore_errors=True)
+            self.profileCopy = ""
+
+
+class ReportTableParser(HTMLParser):
+    """Class to read the rows of an HTML table saved as .xls, as it is fed:
+    Completed rows are collected in rows, so the caller can take them after
+    every chunk instead of holding the whole document.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows = []
+        self.row = None
+        self.cell = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str]]) -> None:
+        if tag == "tr":
+            self.row = []
+        elif tag in ["td", "th"] and self.row is not None:
+            self.cell = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in ["td", "th"] and self.cell is not None:
+            self.row.append("".join(self.cell).strip())
+            self.cell = None
+        elif tag == "tr" and self.row is not None:
+            self.rows.append(self.row)
+            self.row = None
+
+    def handle_data(self, data: str) -> None:
+        if self.cell is not None:
+            self.cell.append(data)
+
+
+class ReportOrderError(ValueError):
+    """Raised when the sections of a report are not in date order."""
+
+
+class ReportReader(object):
+    """Class to read the Destiny Section Schedule Daily Summary export:
+    The export is sniffed for its real format, legacy BIFF, an xlsx workbook
+    or an HTML table saved as .xls, and read row by row with calamine or the
+    HTML parser. Only the used columns are kept, and only sections with final
+    approval, while reading. The result has the same columns and types
+    as reading the export with pandas.read_excel.
+    """
+
+    # Read in courses from Excel
+    # 1     B   Date
+    # 4     E   Start Time
+    # 6     G   End Time
+    # 9     J   Section Number
+    # 11    L   Section Title
+    # 12    M   Instructor
+    # 13    N   Building
+    # 15    P   Room
+    # 17    R   Technology
+    # 18    S   Section Size
+    # 20    U   Notes
+    # 22    W   Approval Status
+    columns = [1, 4, 6, 9, 11, 12, 13, 15, 17, 18, 20, 22]
+    # Names of the used columns, for an empty export without a header row.
+    names = [
+        "Date",
+        "Start Time",
+        "End Time",
+        "Section Number",
+        "Section Title",
+        "Instructor",
+        "Building",
+        "Room",
+        "Technology",
+        "Section Size",
+        "Notes",
+        "Approval Status",
+    ]
+    header = 6
+    approvalColumn = 22
+    dateFormats = {
+        "Date": "%Y/%m/%d %H:%M:%S",
+        "Start Time": "%I:%M%p",
+        "End Time": "%I:%M%p",
+    }
+    chunkSize = 1 << 16
+    # Cells that pandas.read_excel reads as missing values by default.
+    naValues = {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+
+    @staticmethod
+    def sniff(reportPath: str) -> str:
+        # Destiny names every export .xls, whatever it really contains.
+        with open(reportPath, "rb") as report:
+            signature = report.read(512)
+        if signature.startswith(b"\xd0\xcf\x11\xe0"):
+            return "xls"
+        if signature.startswith(b"PK"):
+            return "xlsx"
+        if signature.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"<"):
+            return "html"
+        raise ValueError(f"Unknown report format: {reportPath}")
+
+    @classmethod
+    def isReport(cls, reportPath: str) -> bool:
+        """Function to check that a file is a Section Schedule Daily Summary:
+        Destiny answers with an HTML page, e.g. the login page once the session
+        has expired, where the export was expected.
+        Args:
+            reportPath (str): Path of the downloaded file.
+        Returns:
+            bool: Whether the file has the header row of the export.
+        """
+        try:
+            reportFormat = cls.sniff(reportPath)
+            if reportFormat != "html" and python_calamine is None:
+                names = pd.read_excel(reportPath, header=cls.header, nrows=0).columns
+                names = [names[column] for column in cls.columns]
+            else:
+                names = next(cls.sections(reportPath, reportFormat), [])
+        except (ValueError, IndexError):
+            return False
+        return "Date" in names and "Approval Status" in names
+
+    @classmethod
+    def read(cls, reportPath: str) -> pd.DataFrame:
+        """Function to read the sections with final approval from an export:
+        Args:
+            reportPath (str): Path of the downloaded Destiny report.
+        Returns:
+            DataFrame: Sections of the report, one row per section meeting.
+        """
+        reportFormat = cls.sniff(reportPath)
+        if reportFormat != "html" and python_calamine is None:
+            return cls.readWithPandas(reportPath)
+
+        sections = cls.sections(reportPath, reportFormat)
+        names = next(sections, cls.names)
+        values = [[] for _ in names]
+        for section in sections:
+            for columnValues, value in zip(values, section):
+                columnValues.append(value)
+        return cls.toFrame(names, values, reportFormat)
+
+    @classmethod
+    def readChunks(cls, reportPath: str, chunkDays: int) -> Iterator[pd.DataFrame]:
+        """Function to read an export in chunks of chunkDays days:
+        Only one chunk is built at a time. HTML exports are streamed, while
+        calamine loads a workbook export whole before its rows are read. Like
+        Destiny exports them, the sections have to be in date order.
+        Args:
+            reportPath (str): Path of the downloaded Destiny report.
+            chunkDays (int): Number of days in each chunk.
+        Returns:
+            iterator: Sections of each chunk, in date order, as read returns them.
+        """
+        reportFormat = cls.sniff(reportPath)
+        if reportFormat != "html" and python_calamine is None:
+            schedule = cls.readWithPandas(reportPath)
+            days = (schedule["Date"] - schedule["Date"].min()).dt.days
+            for _, chunk in schedule.groupby(days // chunkDays, sort=True):
+                yield chunk
+            return
+
+        sections = cls.sections(reportPath, reportFormat)
+        names = next(sections, [])
+        values = [[] for _ in names]
+        firstDate = None
+        chunkNum = 0
+        for section in sections:
+            date = cls.sectionDate(section[0])
+            if date is not None:
+                firstDate = firstDate or date
+                sectionChunk = (date - firstDate).days // chunkDays
+                if sectionChunk < chunkNum:
+                    raise ReportOrderError(f"Report is not in date order: {reportPath}")
+                if sectionChunk > chunkNum and values[0]:
+                    yield cls.toFrame(names, values, reportFormat)
+                    values = [[] for _ in names]
+                chunkNum = sectionChunk
+            for columnValues, value in zip(values, section):
+                columnValues.append(value)
+        if values and values[0]:
+            yield cls.toFrame(names, values, reportFormat)
+
+    @classmethod
+    def sections(cls, reportPath: str, reportFormat: str) -> Iterator[List[Any]]:
+        # The used columns of the header row, then of each approved section.
+        if reportFormat == "html":
+            rows = cls.htmlRows(reportPath)
+        else:
+            rows = cls.workbookRows(reportPath)
+        previous = None
+        for rowNum, row in enumerate(rows):
+            if rowNum < cls.header:
+                continue
+            if rowNum == cls.header:
+                yield [str(row[column]) for column in cls.columns]
+                continue
+            # Hold each row back by one, to leave out the footer row.
+            if previous is not None:
+                yield [previous[column] for column in cls.columns]
+            previous = None
+            if (
+                len(row) > cls.approvalColumn
+                and row[cls.approvalColumn] == "Final Approval"
+            ):
+                previous = row
+
+    @staticmethod
+    def sectionDate(value: Any) -> Any:
+        # Day of a Date cell, whether it was read as a date or as text.
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, datetime.date):
+            return value
+        try:
+            return datetime.datetime.strptime(str(value)[:10], "%Y/%m/%d").date()
+        except ValueError:
+            return None
+
+    @classmethod
+    def toFrame(
+        cls, names: List[str], values: List[List[Any]], reportFormat: str
+    ) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                name: cls.toColumn(name, columnValues, reportFormat)
+                for name, columnValues in zip(names, values)
+            }
+        )
+
+    @classmethod
+    def workbookRows(cls, reportPath: str) -> Iterator[List[Any]]:
+        with open(reportPath, "rb") as report:
+            # Open from the file object, so calamine sniffs the content and
+            # not the .xls extension.
+            workbook = python_calamine.CalamineWorkbook.from_filelike(report)
+            sheet = workbook.get_sheet_by_index(0)
+            if sheet.start is None:  # Empty sheet, without any rows.
+                return
+            # Rows start at the first used column, so pad them back out to
+            # column A for the column indexes.
+            padding = [""] * sheet.start[1]
+            for row in sheet.iter_rows():
+                yield padding + row
+
+    @classmethod
+    def htmlRows(cls, reportPath: str) -> Iterator[List[Any]]:
+        parser = ReportTableParser()
+        with open(reportPath, "r", encoding="utf-8", errors="replace") as report:
+            while True:
+                chunk = report.read(cls.chunkSize)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+                yield from parser.rows
+                parser.rows.clear()
+        parser.close()
+        yield from parser.rows
+
+    @classmethod
+    def toColumn(cls, name: str, values: List[Any], reportFormat: str) -> pd.Series:
+        column = pd.Series(values, dtype=object)
+        column = column.where(~column.isin(cls.naValues))
+        if name in cls.dateFormats:
+            return cls.toDatetime(column, cls.dateFormats[name])
+        if reportFormat == "html" and name == "Section Size":
+            try:
+                return pd.to_numeric(column)
+            except ValueError:
+                return column
+        column = column.infer_objects()
+        # Whole numbers read as floats are integers in the export.
+        if column.dtype == "float64" and column.notna().all():
+            if (column % 1 == 0).all():
+                return column.astype("int64")
+        return column
+
+    @staticmethod
+    def toDatetime(column: pd.Series, dateFormat: str) -> pd.Series:
+        # Date cells come through as dates, text cells use the export's format.
+        text = column.map(lambda value: isinstance(value, str))
+        try:
+            dates = pd.to_datetime(column.where(~text))
+            if text.any():
+                dates[text] = pd.to_datetime(column[text], format=dateFormat)
+        except (ValueError, TypeError):
+            return column
+        return dates
+
+    @classmethod
+    def readWithPandas(cls, reportPath: str) -> pd.DataFrame:
+        # Without calamine, read the workbook with the engines of pandas.
+        schedule = pd.read_excel(
+            reportPath,
+            header=cls.header,
+            skipfooter=1,
+            usecols=cls.columns,
+            parse_dates=[1, "Start Time", "End Time"],
+            date_format=cls.dateFormats,
+        )
+        return schedule[schedule["Approval Status"] == "Final Approval"]
+
+
+class ScheduleSchema(object):
+    """Class to hold schedules in a compact, typed form:
+    Repeated text columns are categoricals and times of day are minutes since
+    midnight, which sort and group much faster than text and datetimes.
+    Missing values stay missing in the schedule and only get replaced when
+    rows are displayed, with the replacement declared per column.
+    """
+
+    categoryColumns = [
+        "Building",
+        "Room",
+        "Instructor",
+        "Technology",
+        "Approval Status",
+    ]
+    timeColumns = ["Start Time", "End Time"]
+    # What a missing value is shown as in the schedule.
+    displayNulls = {
+        "Room": "",
+        "Section Size": "",
+        "Section Title": "",
+        "Instructor": "",
+        "Section Number": "",
+        "Technology": "",
+        "Notes": "",
+    }
+    # "%I:%M %p" of every minute of the day, and "" for a missing time.
+    timeLabels = np.array(
+        [
+            f"{(minute // 60 - 1) % 12 + 1:02d}:{minute % 60:02d} "
+            f"{'AM' if minute < 720 else 'PM'}"
+            for minute in range(1440)
+        ]
+        + [""],
+        dtype=object,
+    )
+
+    @classmethod
+    def compact(cls, schedule: pd.DataFrame) -> pd.DataFrame:
+        """Function to convert a schedule to the compact types:
+        Columns that already have them are left as they are, and a schedule
+        that is already compact is returned as it is, without a copy.
+        Args:
+            schedule (DataFrame): Schedule as read from the report.
+        Returns:
+            DataFrame: Schedule with categorical text and Int16 minute times.
+        """
+        categoryColumns = [
+            column
+            for column in cls.categoryColumns
+            if column in schedule and schedule[column].dtype != "category"
+        ]
+        timeColumns = [
+            column
+            for column in cls.timeColumns
+            if column in schedule and schedule[column].dtype != "Int16"
+        ]
+        if not categoryColumns and not timeColumns:
+            return schedule
+
+        schedule = schedule.copy()
+        for column in categoryColumns:
+            schedule[column] = schedule[column].astype("category")
+        for column in timeColumns:
+            times = pd.to_datetime(schedule[column], errors="coerce")
+            schedule[column] = (times.dt.hour * 60 + times.dt.minute).astype("Int16")
+        return schedule
+
+    @staticmethod
+    def chunks(schedule: Any) -> Iterator[pd.DataFrame]:
+        # A schedule is either one DataFrame or an iterator of date-ordered
+        # chunks of it. Empty chunks are left out.
+        if isinstance(schedule, pd.DataFrame):
+            schedule = [schedule]
+        return (chunk for chunk in schedule if not chunk.empty)
+
+    @classmethod
+    def sortedChunks(cls, schedule: Any, by: List[str]) -> Iterator[pd.DataFrame]:
+        for chunk in cls.chunks(schedule):
+            yield cls.compact(chunk).sort_values(by=by)
+
+    @classmethod
+    def displayColumn(cls, schedule: pd.DataFrame, column: str) -> List[Any]:
+        # Values of a column as shown, with missing values replaced.
+        values = schedule[column]
+        if values.isna().any():
+            values = values.astype(object).fillna(cls.displayNulls[column])
+        return values.tolist()
+
+    @staticmethod
+    def memoryReport(schedule: pd.DataFrame) -> str:
+        # Memory used by every column of the schedule, for the log.
+        usage = schedule.memory_usage(index=False, deep=True)
+        lines = [
+            f"    {column:<16}{str(schedule[column].dtype):<16}{size / 1024:>10.1f} KB"
+            for column, size in usage.items()
+        ]
+        lines.append(f"    {'Total':<32}{usage.sum() / 1024:>10.1f} KB")
+        return "\n".join(lines)
+
+
+class ScheduleStyles(object):
+    """Class to resolve the named cell styles of a schedule workbook:
+    The styles are declared once here. Each is added to the workbook as an
+    xlsxwriter Format the first time it is used, and the same Format is
+    returned after that, so a workbook only holds the styles it uses.
+    Args:
+        workbook (Workbook): xlsxwriter workbook to add the formats to.
+    """
+
+    base = {"font_name": "Calibri", "font_size": 11, "text_wrap": False}
+    styles = {
+        "location": {"bold": True, "font_color": "#000000", "bg_color": "#FFC000"},
+        "generated": {"bold": True, "font_color": "#C00000", "bg_color": "#FDE9D9"},
+        "header": {"bold": True, "bottom": 2, "bottom_color": "#000000"},
+        "body": {"bold": False, "valign": "top", "font_color": "#000000"},
+        "daySeparator": {
+            "bold": True,
+            "font_color": "#000000",
+            "bg_color": "#00B050",
+        },
+        "room": {"bold": True, "font_color": "#C00000"},
+        "laptopReady": {"bold": True, "italic": True, "font_color": "#0070C0"},
+        "instructor": {"bold": False, "font_color": "#C00000"},
+        # AM
+        "am": {"bold": False, "font_color": "#FF0000", "bg_color": "#DAEEF3"},
+        # Computer Lab
+        "lab": {"bold": True, "font_color": "#FF0000", "bg_color": "#FFFF00"},
+    }
+
+    def __init__(self, workbook: Any) -> None:
+        self.workbook = workbook
+        self.formats = {}
+
+    def __getitem__(self, name: str) -> Any:
+        """Function to get the format of a style in this workbook:
+        Args:
+            name (str): Name of the style in styles.
+        Returns:
+            Format: xlsxwriter format of the style.
+        """
+        if name not in self.formats:
+            self.formats[name] = self.workbook.add_format(
+                {**self.base, **self.styles[name]}
+            )
+        return self.formats[name]
+
+
+class ScheduleRows(object):
+    """Class to lay out the rows of a schedule before writing them:
+    The shown value and the style of every cell are worked out with column
+    operations over a whole chunk of the schedule. The rows are then written
+    in order, each as a few runs of cells that share a style, which gives the
+    same workbook as writing the cells one by one.
+    Args:
+        schedule (DataFrame): Sorted compact schedule of whole days.
+        blocks (list): Start minute of each time block of the day after the
+            first, e.g. [720, 1020] for morning, afternoon and evening.
+        isLab (function): Whether a room is a computer lab.
+    """
+
+    # Style of each column, Date to Notes, for styles that vary by row.
+    columnStyles = ["body", "room", "body", "body", "body", "body", "instructor"]
+    columnStyles += ["body", "body", "body"]
+    # Time labels as shown, without the leading zero of the hour.
+    timeCells = np.array(
+        [label.lstrip("0") for label in ScheduleSchema.timeLabels], dtype=object
+    )
+
+    def __init__(
+        self, schedule: pd.DataFrame, blocks: List[int], isLab: Callable[[str], bool]
+    ) -> None:
+        self.blockCount = len(blocks) + 1
+        minutes = schedule["Start Time"].fillna(-1).to_numpy(dtype=np.int64)
+        endMinutes = schedule["End Time"].fillna(-1).to_numpy(dtype=np.int64)
+        # Block of the day each row starts in, or -1 without a start time.
+        self.block = np.where(
+            minutes < 0, -1, np.searchsorted(blocks, minutes, side="right")
+        )
+        dayIndex, self.dates = pd.factorize(schedule["Date"].dt.date)
+        self.dayCounts = np.bincount(dayIndex, minlength=len(self.dates))
+        # Sort once by day, then block of the day, so that the rows of every
+        # block are one slice of order. Rows without a start time are listed
+        # in the first block of their day, in the order of the sort.
+        key = dayIndex * self.blockCount + np.maximum(self.block, 0)
+        self.order = np.argsort(key, kind="stable")
+        self.sortedKeys = key[self.order]
+
+        rooms = {
+            room: self.roomCell(room, isLab)
+            for room in set(ScheduleSchema.displayColumn(schedule, "Room"))
+        }
+        roomCells = [
+            rooms[room] for room in ScheduleSchema.displayColumn(schedule, "Room")
+        ]
+        titles = ScheduleSchema.displayColumn(schedule, "Section Title")
+        instructors = [
+            "TBA" if instructor == "Instructor To Be Announced" else instructor
+            for instructor in ScheduleSchema.displayColumn(schedule, "Instructor")
+        ]
+        self.rows = list(
+            zip(
+                [room for room, _ in roomCells],
+                ScheduleSchema.displayColumn(schedule, "Section Size"),
+                self.timeCells[np.where(minutes < 0, 1440, minutes)],
+                self.timeCells[np.where(endMinutes < 0, 1440, endMinutes)],
+                titles,
+                instructors,
+                ScheduleSchema.displayColumn(schedule, "Section Number"),
+                ScheduleSchema.displayColumn(schedule, "Technology"),
+                ScheduleSchema.displayColumn(schedule, "Notes"),
+            )
+        )
+
+        # AM times are highlighted in the first block of the day only.
+        firstBlock = self.block == 0
+        self.styles = list(
+            zip(
+                [style for _, style in roomCells],
+                (firstBlock & (minutes >= 0) & (minutes < 720)).tolist(),
+                (firstBlock & (endMinutes >= 0) & (endMinutes < 720)).tolist(),
+                ["Boot Camp" in title for title in titles],
+            )
+        )
+        self.layouts = {}
+
+    @staticmethod
+    def roomCell(room: str, isLab: Callable[[str], bool]) -> Tuple[Any, str]:
+        # Room number, or short room name, and its style.
+        if isLab(room):
+            return int(room.replace("Classroom ", "")), "lab"
+        if "Conference Room" in room:
+            return room.replace("Conference Room ", "CR"), "room"
+        if room.replace("Classroom ", "").isdigit():
+            return int(room.replace("Classroom ", "")), "room"
+        return room.replace("Classroom ", "").lstrip("0"), "room"
+
+    def layout(self, style: Tuple[str, bool, bool, bool]) -> List[Tuple[int, int, str]]:
+        """Function to find the runs of cells that share a style in a row:
+        Args:
+            style (tuple): Room style, AM start, AM end and boot camp of the row.
+        Returns:
+            list: First column, column after the last and style of each run.
+        """
+        if style not in self.layouts:
+            roomStyle, amStart, amEnd, bootCamp = style
+            styles = list(self.columnStyles)
+            styles[1] = roomStyle
+            styles[3] = "am" if amStart else "body"
+            styles[4] = "am" if amEnd else "body"
+            styles[5] = "laptopReady" if bootCamp else "body"
+            runs = []
+            for column, columnStyle in enumerate(styles):
+                if runs and runs[-1][2] == columnStyle:
+                    runs[-1] = (runs[-1][0], column + 1, columnStyle)
+                else:
+                    runs.append((column, column + 1, columnStyle))
+            self.layouts[style] = runs
+        return self.layouts[style]
+
+    def write(self, worksheet: Any, styles: ScheduleStyles, excelRow: int) -> int:
+        """Function to write every day of the schedule to the worksheet:
+        Args:
+            worksheet (obj): xlsxwriter worksheet to write to.
+            styles (ScheduleStyles): Formats of the workbook.
+            excelRow (int): Row to write the first day to.
+        Returns:
+            int: Row after the last one written.
+        """
+        for i, date in enumerate(self.dates):
+            dayLabel = (
+                f"{date.strftime('%A')}, "
+                f"{date.strftime('%B %d, %Y').replace(' 0', ' ')}"
+            )
+            worksheet.write(excelRow, 0, dayLabel, styles["daySeparator"])
+            worksheet.write_number(excelRow, 3, int(self.dayCounts[i]), styles["am"])
+            excelRow += 1
+            first, last = np.searchsorted(
+                self.sortedKeys, [i * self.blockCount, (i + 1) * self.blockCount]
+            )
+            for position in self.order[first:last]:
+                cells = (dayLabel,) + self.rows[position]
+                for start, end, style in self.layout(self.styles[position]):
+                    worksheet.write_row(
+                        excelRow, start, cells[start:end], styles[style]
+                    )
+                excelRow += 1
+        return excelRow
+
+
+class GoogleClients(object):
+    """Class to share the Google API clients of the service account in a process:
+    The credentials, one authorized HTTP transport and each API client are
+    created once, when first used. The clients are built from the discovery
+    documents bundled with google-api-python-client instead of fetching them.
+    The transport keeps its connections open between requests, and the
+    access token is only refreshed once it has expired.
+    """
+
+    keyFile = "service_file.json"
+    scope = [
+        "https://www.googleapis.com/auth/drive",
+        "https://www.googleapis.com/auth/calendar",
+    ]
+    instance = None
+    lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.credentials = ServiceAccountCredentials.from_json_keyfile_name(
+            self.keyFile, self.scope
+        )
+        self.http = self.credentials.authorize(httplib2.Http())
+        self.resources = {}
+        self.googleDrive = None
+
+    @classmethod
+    def get(cls) -> "GoogleClients":
+        """Function to get the clients of this process:
+        Returns:
+            GoogleClients: Clients with a valid access token.
+        """
+        with cls.lock:
+            if cls.instance is None:
+                cls.instance = cls()
+            # Without a token yet, the transport gets one with the first request.
+            if cls.instance.credentials.access_token_expired:
+                cls.instance.credentials.refresh(httplib2.Http())
+            return cls.instance
+
+    def resource(self, serviceName: str, version: str) -> Resource:
+        # API client of a Google service, e.g. ("calendar", "v3").
+        if (serviceName, version) not in self.resources:
+            self.resources[serviceName, version] = build(
+                serviceName, version, http=self.http, static_discovery=True
+            )
+        return self.resources[serviceName, version]
+
+    def drive(self) -> GoogleDrive:
+        # PyDrive2 Google Drive on the same credentials, transport and client.
+        if self.googleDrive is None:
+            gauth = GoogleAuth()
+            # Refresh expired tokens from the service account key, instead of
+            # PyDrive2's default of asking for a login in the browser.
+            gauth.auth_method = "service"
+            gauth.credentials = self.credentials
+            gauth.http = self.http
+            gauth.thread_local.http = self.http
+            gauth.service = self.resource("drive", "v2")
+            self.googleDrive = GoogleDrive(gauth)
+        return self.googleDrive
+
+
+class SheetsWorksheet(object):
+    """Class to collect a schedule worksheet for Google Sheets:
+    Takes the xlsxwriter worksheet calls of the schedule renderers and keeps
+    the cells, column widths and frozen rows, to be sent by SheetsWorkbook.
+    Args:
+        title (str): Name of the sheet.
+    """
+
+    # Page setup only applies to printing the xlsx workbook.
+    printSettings = [
+        "set_default_row",
+        "set_landscape",
+        "hide_gridlines",
+        "fit_to_pages",
+        "center_horizontally",
+        "center_vertically",
+        "set_paper",
+        "set_margins",
+        "set_header",
+        "set_footer",
+    ]
+
+    def __init__(self, title: str) -> None:
+        self.title = title
+        self.cells = {}
+        self.columnWidths = {}
+        self.frozenRows = 0
+        self.columnCount = 0
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name in self.printSettings:
+            return lambda *args, **kwargs: None
+        raise AttributeError(name)
+
+    def set_column(
+        self, columns: str, width: Any, cellFormat: Any = None, options: Any = None
+    ) -> None:
+        # Hidden columns are left out of the sheet instead.
+        if options and options.get("hidden"):
+            return
+        first, last = [
+            xl_cell_to_rowcol(f"{column}1")[1] for column in columns.split(":")
+        ]
+        for column in range(first, last + 1):
+            self.columnWidths[column] = width
+        self.columnCount = max(self.columnCount, last + 1)
+
+    def freeze_panes(self, row: int, column: int) -> None:
+        self.frozenRows = row
+
+    def write(self, row: int, column: int, value: Any, cellFormat: Any) -> None:
+        self.cells.setdefault(row, {})[column] = (value, cellFormat)
+
+    def write_row(self, row: int, column: int, values: Any, cellFormat: Any) -> None:
+        for offset, value in enumerate(values):
+            self.write(row, column + offset, value, cellFormat)
+
+    write_number = write
+
+
+class SheetsWriteError(RuntimeError):
+    """Raised when a schedule could not be written to Google Sheets."""
+
+
+class SheetsWorkbook(object):
+    """Class to write a schedule straight to a Google Sheet in its Drive folder:
+    Has the xlsxwriter workbook calls used by the schedule renderers. Closing
+    it creates the Sheet, or overwrites the one of the same name, with the
+    cells, formats, column widths and frozen rows in spreadsheets.batchUpdate
+    requests, without writing or converting an xlsx file.
+    Args:
+        title (str): Name of the Sheet in Google Drive.
+        folderId (str): Google Drive folder ID to create the Sheet in.
+    """
+
+    mimeType = "application/vnd.google-apps.spreadsheet"
+    # Rows of each batchUpdate, about 1.5 MB, to keep requests under the size limit.
+    rowsPerRequest = 500
+
+    def __init__(self, title: str, folderId: str) -> None:
+        self.title = title
+        self.folderId = folderId
+        self.worksheet = None
+
+    def add_worksheet(self, name: str) -> SheetsWorksheet:
+        self.worksheet = SheetsWorksheet(name)
+        return self.worksheet
+
+    def add_format(self, properties: Dict[str, Any]) -> Dict[str, Any]:
+        return self.cellFormat(properties)
+
+    def close(self) -> None:
+        # The Sheet is only written here, so a failure has to reach the caller
+        # before the schedule is published.
+        try:
+            clients = GoogleClients.get()
+            drive = clients.resource("drive", "v3")
+            sheets = clients.resource("sheets", "v4")
+            spreadsheetId = self.spreadsheetId(drive)
+            sheetId = (
+                sheets.spreadsheets()
+                .get(spreadsheetId=spreadsheetId, fields="sheets.properties.sheetId")
+                .execute()["sheets"][0]["properties"]["sheetId"]
+            )
+            for body in self.requests(sheetId):
+                sheets.spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheetId, body=body
+                ).execute()
+        except Exception as error:
+            raise SheetsWriteError(
+                f"Could not write {self.title} to Google Sheets: {error}"
+            ) from error
+
+    def spreadsheetId(self, drive: Resource) -> str:
+        """Function to find the Sheet to overwrite, or create a new one:
+        Args:
+            drive (obj): Google Drive v3 service.
+        Returns:
+            str: ID of the Sheet.
+        """
+        files = (
+            drive.files()
+            .list(
+                q=(
+                    f"name='{self.title}' and '{self.folderId}' in parents "
+                    f"and mimeType='{self.mimeType}' and trashed=false"
+                ),
+                fields="files(id)",
+            )
+            .execute()
+            .get("files", [])
+        )
+        if files:
+            return files[0]["id"]
+        return (
+            drive.files()
+            .create(
+                body={
+                    "name": self.title,
+                    "mimeType": self.mimeType,
+                    "parents": [self.folderId],
+                },
+                fields="id",
+            )
+            .execute()["id"]
+        )
+
+    def requests(self, sheetId: int) -> List[Dict[str, Any]]:
+        """Function to build the batchUpdate bodies that write the worksheet:
+        The first one sets up the sheet and clears what was in it before.
+        Args:
+            sheetId (int): ID of the sheet to write to.
+        Returns:
+            list: Body of each batchUpdate, in order.
+        """
+        worksheet = self.worksheet
+        rowCount = max(worksheet.cells, default=0) + 1
+        requests = [
+            {
+                "updateSheetProperties": {
+                    "properties": {
+                        "sheetId": sheetId,
+                        "title": worksheet.title,
+                        "gridProperties": {
+                            "rowCount": max(rowCount, worksheet.frozenRows + 1),
+                            "columnCount": worksheet.columnCount,
+                            "frozenRowCount": worksheet.frozenRows,
+                        },
+                    },
+                    "fields": "title,gridProperties",
+                }
+            }
+        ]
+        for column, width in worksheet.columnWidths.items():
+            requests.append(
+                {
+                    "updateDimensionProperties": {
+                        "range": {
+                            "sheetId": sheetId,
+                            "dimension": "COLUMNS",
+                            "startIndex": column,
+                            "endIndex": column + 1,
+                        },
+                        # Same conversion of character widths as xlsxwriter.
+                        "properties": {"pixelSize": int(width * 7 + 0.5) + 5},
+                        "fields": "pixelSize",
+                    }
+                }
+            )
+
+        bodies = []
+        for start in range(0, rowCount, self.rowsPerRequest):
+            rows = [
+                {"values": self.rowData(worksheet.cells.get(row, {}))}
+                for row in range(start, min(start + self.rowsPerRequest, rowCount))
+            ]
+            updateCells = {
+                "rows": rows,
+                "fields": "userEnteredValue,userEnteredFormat",
+            }
+            if start:
+                updateCells["start"] = {
+                    "sheetId": sheetId,
+                    "rowIndex": start,
+                    "columnIndex": 0,
+                }
+            else:  # Clear the whole sheet, then write the first rows.
+                updateCells["range"] = {"sheetId": sheetId}
+            requests.append({"updateCells": updateCells})
+            bodies.append({"requests": requests})
+            requests = []
+        return bodies
+
+    @staticmethod
+    def rowData(cells: Dict[int, Tuple[Any, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Function to convert the cells of a row to Sheets CellData:
+        Args:
+            cells (dict): Value and format of each written column.
+        Returns:
+            list: CellData of each column up to the last written one.
+        """
+        values = []
+        for column in range(max(cells, default=-1) + 1):
+            value, cellFormat = cells.get(column, ("", None))
+            cell = {"userEnteredFormat": cellFormat} if cellFormat else {}
+            if isinstance(value, (int, float, np.number)) and not pd.isna(value):
+                cell["userEnteredValue"] = {"numberValue": float(value)}
+            elif isinstance(value, str) and value:
+                cell["userEnteredValue"] = {"stringValue": value}
+            values.append(cell)
+        return values
+
+    @staticmethod
+    def cellFormat(properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Function to convert xlsxwriter format properties to a Sheets CellFormat:
+        Args:
+            properties (dict): Properties as given to add_format.
+        Returns:
+            dict: CellFormat of the Sheets API.
+        """
+
+        def color(value: str) -> Dict[str, float]:
+            red, green, blue = bytes.fromhex(value.lstrip("#"))
+            return {"red": red / 255, "green": green / 255, "blue": blue / 255}
+
+        textFormat = {
+            "fontFamily": properties.get("font_name", "Calibri"),
+            "fontSize": properties.get("font_size", 11),
+            "bold": properties.get("bold", False),
+            "italic": properties.get("italic", False),
+        }
+        if "font_color" in properties:
+            textFormat["foregroundColor"] = color(properties["font_color"])
+        cellFormat = {
+            "textFormat": textFormat,
+            "wrapStrategy": "WRAP" if properties.get("text_wrap") else "OVERFLOW_CELL",
+        }
+        if "bg_color" in properties:
+            cellFormat["backgroundColor"] = color(properties["bg_color"])
+        if properties.get("valign") == "top":
+            cellFormat["verticalAlignment"] = "TOP"
+        if properties.get("align") == "right":
+            cellFormat["horizontalAlignment"] = "RIGHT"
+        if properties.get("bottom"):
+            cellFormat["borders"] = {
+                "bottom": {
+                    "style": "SOLID_MEDIUM" if properties["bottom"] == 2 else "SOLID",
+                    "color": color(properties.get("bottom_color", "#000000")),
+                }
+            }
+        return cellFormat
+
+
+def renderSchedule(
+    settings: Dict[str, Any], schedule: pd.DataFrame, location: str
+) -> Tuple[str, str, Any]:
+    """Function to create the Excel schedule of a center in a worker process:
+    Args:
+        settings (dict): Values of Ui_mainWindow.renderSettings.
+        schedule (DataFrame): Compact schedule of the center.
+        location (str): Center code, GBC or SFC.
+    Returns:
+        tuple: File name and first date of the schedule, and the workbook
+            rendered in memory, if any.
+    """
+    # The renderers only need the settings, not the window.
+    renderer = Ui_mainWindow.__new__(Ui_mainWindow)
+    vars(renderer).update(settings)
+    renderer.workbookBuffers = {}
+    if location == "SFC":
+        fileName, date = renderer.SFCSchedule(schedule, location)
+    else:
+        fileName, date = renderer.GBCSchedule(schedule, location)
+    return fileName, date, renderer.workbookBuffers.get(fileName)
+
 
 # Main Window for GUI
 class Ui_mainWindow(object):
@@ -41,17 +1674,67 @@ class Ui_mainWindow(object):
     GBCCalendarId = ""
     attachSFCSchedule = True
     SFCCalendarId = ""
+    parallelDownload = True
+    downloadTimeout = 600
+    maxParallelReports = 8
+    keepBrowserOpen = True
+    headlessBrowser = True
+    browserProfilePath = ""
+    directDownload = False
+    destinyUrl = "https://berkeleysv.destinysolutions.com"
+    reportCachePath = ""
+    reportCacheTtl = 3600
+    reportCacheSize = 256
+    forceRefreshReports = False
+    splitReportDays = 7
+    incrementalRefresh = False
+    hotWindowDays = 3
+    scheduleStatePath = ""
+    leanBrowsing = True
+    scheduleCachePath = ""
+    scheduleCacheSize = 256
+    streamReportDays = 0
+    combinedDownload = False
+    GBCTimeBlocks = "12:00,17:00"
+    SFCTimeBlocks = "17:00"
+    constantMemoryRows = 5000
+    parallelRender = False
+    # Settings used by GBCSchedule and SFCSchedule.
+    sheetsOutput = False
+    inMemoryUpload = False
+    saveLocalCopy = True
+    xlsxMimeType = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    skipUnchangedSchedules = True
+    perDaySchedules = False
+    # Change when the layout of the schedules changes, to create them again.
+    scheduleHashVersion = 1
+    renderSettings = [
+        "saveReportToPath",
+        "sheetsOutput",
+        "inMemoryUpload",
+        "uploadGBCSchedule",
+        "GBCGDriveFolderId",
+        "uploadSFCSchedule",
+        "SFCGDriveFolderId",
+        "GBCTimeBlocks",
+        "SFCTimeBlocks",
+        "constantMemoryRows",
+    ]
     center = {
         "Golden Bear Center": {
             "campus": "Berkeley - CA0001",
             "building": (
                 "UC Berkeley Extension Golden Bear Center, 1995 University Ave. - GBC"
             ),
+            "name": "GBC",
         },
         "San Francisco Center": {
             "campus": "San Francisco - CA0003",
             "building": "San Francisco Campus, 160 Spear St. - SFCAMPUS",
+            "name": "SFC",
         },
+        # Report of every campus and building, split by center after download.
+        "All Centers": {"campus": "", "building": "", "name": "ALL"},
     }
 
     centerReverse = {
@@ -91,6 +1774,86 @@ class Ui_mainWindow(object):
             "attachSFCSchedule", True, type=bool
         )
         self.SFCCalendarId = self.settings.value("SFCCalendarId", "", type=str)
+        self.parallelDownload = self.settings.value("parallelDownload", True, type=bool)
+        self.downloadTimeout = self.settings.value("downloadTimeout", 600, type=int)
+        self.maxParallelReports = self.settings.value("maxParallelReports", 8, type=int)
+        self.keepBrowserOpen = self.settings.value("keepBrowserOpen", True, type=bool)
+        self.headlessBrowser = self.settings.value("headlessBrowser", True, type=bool)
+        self.browserProfilePath = self.settings.value(
+            "browserProfilePath",
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "ChromeProfile"),
+            type=str,
+        )
+        self.directDownload = self.settings.value("directDownload", False, type=bool)
+        self.destinyUrl = self.settings.value(
+            "destinyUrl", "https://berkeleysv.destinysolutions.com", type=str
+        ).rstrip("/")
+        self.reportForms = {}
+        self.reportCachePath = self.settings.value(
+            "reportCachePath",
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "ReportCache"),
+            type=str,
+        )
+        self.reportCacheTtl = self.settings.value("reportCacheTtl", 3600, type=int)
+        self.reportCacheSize = self.settings.value("reportCacheSize", 256, type=int)
+        self.forceRefreshReports = self.settings.value(
+            "forceRefreshReports", False, type=bool
+        )
+        self.splitReportDays = self.settings.value("splitReportDays", 7, type=int)
+        self.incrementalRefresh = self.settings.value(
+            "incrementalRefresh", False, type=bool
+        )
+        self.hotWindowDays = self.settings.value("hotWindowDays", 3, type=int)
+        self.scheduleStatePath = self.settings.value(
+            "scheduleStatePath",
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "ScheduleState"),
+            type=str,
+        )
+        self.leanBrowsing = self.settings.value("leanBrowsing", True, type=bool)
+        self.scheduleCachePath = self.settings.value(
+            "scheduleCachePath",
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "ScheduleCache"),
+            type=str,
+        )
+        self.scheduleCacheSize = self.settings.value("scheduleCacheSize", 256, type=int)
+        self.streamReportDays = self.settings.value("streamReportDays", 0, type=int)
+        self.combinedDownload = self.settings.value(
+            "combinedDownload", False, type=bool
+        )
+        self.GBCTimeBlocks = self.settings.value(
+            "GBCTimeBlocks", "12:00,17:00", type=str
+        )
+        self.SFCTimeBlocks = self.settings.value("SFCTimeBlocks", "17:00", type=str)
+        self.constantMemoryRows = self.settings.value(
+            "constantMemoryRows", 5000, type=int
+        )
+        self.parallelRender = self.settings.value("parallelRender", False, type=bool)
+        self.sheetsOutput = self.settings.value("sheetsOutput", False, type=bool)
+        self.inMemoryUpload = self.settings.value("inMemoryUpload", False, type=bool)
+        self.saveLocalCopy = self.settings.value("saveLocalCopy", True, type=bool)
+        self.skipUnchangedSchedules = self.settings.value(
+            "skipUnchangedSchedules", True, type=bool
+        )
+        self.perDaySchedules = self.settings.value("perDaySchedules", False, type=bool)
+        self.destinySession = DestinySession(
+            self.browserProfilePath,
+            self.saveReportToPath,
+            self.headlessBrowser,
+            self.destinyUrl,
+            self.leanBrowsing,
+        )
+        self.reportCache = ReportCache(
+            self.reportCachePath, self.reportCacheTtl, self.reportCacheSize << 20
+        )
+        self.scheduleCache = ScheduleCache(
+            self.scheduleCachePath, self.scheduleCacheSize << 20
+        )
+        # Workbooks rendered in memory by file name, until they are uploaded.
+        self.workbookBuffers = {}
+        # Worker processes of parallelRender, started when first needed.
+        self.renderPool = None
+        # Files of each Google Drive folder by title, listed once per run.
+        self.folderListings = {}
 
     def setupUi(self, mainWindow: QtWidgets.QWidget) -> None:
         mainWindow.setObjectName("mainWindow")
@@ -453,6 +2216,41 @@ class Ui_mainWindow(object):
             self.settings.setValue("GBCCalendarId", self.GBCCalendarId)
             self.settings.setValue("attachSFCSchedule", self.attachSFCSchedule)
             self.settings.setValue("SFCCalendarId", self.SFCCalendarId)
+            self.settings.setValue("parallelDownload", self.parallelDownload)
+            self.settings.setValue("downloadTimeout", self.downloadTimeout)
+            self.settings.setValue("maxParallelReports", self.maxParallelReports)
+            self.settings.setValue("keepBrowserOpen", self.keepBrowserOpen)
+            self.settings.setValue("headlessBrowser", self.headlessBrowser)
+            self.settings.setValue("browserProfilePath", self.browserProfilePath)
+            self.settings.setValue("directDownload", self.directDownload)
+            self.settings.setValue("destinyUrl", self.destinyUrl)
+            self.settings.setValue("reportCachePath", self.reportCachePath)
+            self.settings.setValue("reportCacheTtl", self.reportCacheTtl)
+            self.settings.setValue("reportCacheSize", self.reportCacheSize)
+            self.settings.setValue("forceRefreshReports", self.forceRefreshReports)
+            self.settings.setValue("splitReportDays", self.splitReportDays)
+            self.settings.setValue("incrementalRefresh", self.incrementalRefresh)
+            self.settings.setValue("hotWindowDays", self.hotWindowDays)
+            self.settings.setValue("scheduleStatePath", self.scheduleStatePath)
+            self.settings.setValue("leanBrowsing", self.leanBrowsing)
+            self.settings.setValue("scheduleCachePath", self.scheduleCachePath)
+            self.settings.setValue("scheduleCacheSize", self.scheduleCacheSize)
+            self.settings.setValue("streamReportDays", self.streamReportDays)
+            self.settings.setValue("combinedDownload", self.combinedDownload)
+            self.settings.setValue("GBCTimeBlocks", self.GBCTimeBlocks)
+            self.settings.setValue("SFCTimeBlocks", self.SFCTimeBlocks)
+            self.settings.setValue("constantMemoryRows", self.constantMemoryRows)
+            self.settings.setValue("parallelRender", self.parallelRender)
+            self.settings.setValue("sheetsOutput", self.sheetsOutput)
+            self.settings.setValue("inMemoryUpload", self.inMemoryUpload)
+            self.settings.setValue("saveLocalCopy", self.saveLocalCopy)
+            self.settings.setValue(
+                "skipUnchangedSchedules", self.skipUnchangedSchedules
+            )
+            self.settings.setValue("perDaySchedules", self.perDaySchedules)
+            if self.renderPool is not None:
+                self.renderPool.shutdown()
+            self.destinySession.quit()
             sys.exit()
         else:
             pass
@@ -495,191 +2293,970 @@ class Ui_mainWindow(object):
             QMessageBox.warning(None, "Done", "Done creating signs.")
 
     def genReportFunction(self, startDate: str, endDate: str) -> bool:
-        # Set Chrome defaults to automate download
-        service = Service()
-        chrome_options = Options()
-        chrome_options.add_experimental_option(
-            "prefs",
-            {
-                "download.default_directory": self.saveReportToPath,
-                "download.prompt_for_download": False,
-                "download.directory_upgrade": True,
-                "safebrowsing.endabled": True,
-            },
-        )
-
         locationList = []
         if self.GBCScheduleOutput:
             locationList.append("Golden Bear Center")
         if self.SFCScheduleOutput:
             locationList.append("San Francisco Center")
 
-        # Delete old report if it exists
-        if os.path.exists(f"{self.saveReportToPath}\\SectionScheduleDailySummary.xls"):
-            os.remove(f"{self.saveReportToPath}\\SectionScheduleDailySummary.xls")
-        if os.path.exists(
-            f"{self.saveReportToPath}\\SectionScheduleDailySummary (1).xls"
-        ):
-            os.remove(f"{self.saveReportToPath}\\SectionScheduleDailySummary (1).xls")
-        if os.path.exists(
-            f"{self.saveReportToPath}\\SectionScheduleDailySummary (2).xls"
-        ):
-            os.remove(f"{self.saveReportToPath}\\SectionScheduleDailySummary (2).xls")
-        if os.path.exists(
-            f"{self.saveReportToPath}\\SectionScheduleDailySummary (3).xls"
-        ):
-            os.remove(f"{self.saveReportToPath}\\SectionScheduleDailySummary (3).xls")
-
-        reportPath = []
-        try:
-            browser = webdriver.Chrome(service=service, options=chrome_options)
-            browser.get("https://berkeleysv.destinysolutions.com")
-            WebDriverWait(browser, 3600).until(
-                EC.presence_of_element_located((By.ID, "main-area-body"))
+        scheduleState = {}
+        refreshRanges = {}
+        for location in locationList:
+            # Streamed schedules are never held whole, so they are not kept.
+            scheduleState[location] = (
+                {} if self.streamReportDays > 0 else self.loadScheduleState(location)
             )
-            for i in range(len(locationList)):
-                # Download Destiny Report
-                browser.get(
-                    "https://berkeleysv.destinysolutions.com/srs/reporting/sectionScheduleDailySummary.do?method=load"  # noqa: E501
+            refreshRanges[location] = self.planRefresh(
+                scheduleState[location], startDate, endDate
+            )
+        if self.combinedDownload and locationList:
+            # One report of all centers covers the days any of them needs.
+            refreshRanges = {
+                "All Centers": self.mergeDateRanges(
+                    [dates for ranges in refreshRanges.values() for dates in ranges]
                 )
+            }
 
-                startDateElm = browser.find_element("id", "startDateRecordString")
-                startDateElm.send_keys(startDate)
-                endDateElm = browser.find_element("id", "endDateRecordString")
-                endDateElm.send_keys(endDate)
-                campusElm = browser.find_element("name", "scheduleBlock.campusId")
-                campusElm.send_keys(self.center[locationList[i]]["campus"])
-                buildingElm = browser.find_element("name", "scheduleBlock.buildingId")
-                buildingElm.send_keys(self.center[locationList[i]]["building"])
-                outputTypeElm = browser.find_element("name", "outputType")
-                outputTypeElm.send_keys("Output to XLS (Export)")
-                generateReportElm = browser.find_element("id", "processReport")
-                generateReportElm.click()
-                if i == 0:
-                    while not os.path.exists(
-                        f"{self.saveReportToPath}\\SectionScheduleDailySummary.xls"
-                    ):
-                        time.sleep(1)
-                    reportPath.append(
-                        f"{self.saveReportToPath}\\SectionScheduleDailySummary.xls"
-                    )
-                elif i == 1:
-                    while not os.path.exists(
-                        f"{self.saveReportToPath}\\SectionScheduleDailySummary (1).xls"
-                    ):
-                        time.sleep(1)
-                    reportPath.append(
-                        f"{self.saveReportToPath}\\SectionScheduleDailySummary (1).xls"
-                    )
-                elif i == 2:
-                    while not os.path.exists(
-                        f"{self.saveReportToPath}\\SectionScheduleDailySummary (2).xls"
-                    ):
-                        time.sleep(1)
-                    reportPath.append(
-                        f"{self.saveReportToPath}\\SectionScheduleDailySummary (2).xls"
-                    )
-                else:
-                    while not os.path.exists(
-                        f"{self.saveReportToPath}\\SectionScheduleDailySummary (3).xls"
-                    ):
-                        time.sleep(1)
-                    reportPath.append(
-                        f"{self.saveReportToPath}\\SectionScheduleDailySummary (3).xls"
+        # One report per center and date range chunk, named for its file.
+        reportList = {}
+        for location, ranges in refreshRanges.items():
+            for rangeStart, rangeEnd in ranges:
+                for chunkStart, chunkEnd in self.splitDateRange(rangeStart, rangeEnd):
+                    name = self.center[location]["name"]
+                    if (chunkStart, chunkEnd) != (startDate, endDate):
+                        name = f"{name} {chunkStart}"
+                    reportList[name] = (location, chunkStart, chunkEnd)
+
+        with RunWorkspace() as workspace:
+            # Reuse the reports downloaded for the same center and date range.
+            reportPath = {}
+            for name, report in reportList.items():
+                path = workspace.reportPath(name)
+                if not self.forceRefreshReports and self.reportCache.get(
+                    self.reportKey(*report), path
+                ):
+                    print(f"[Info] Using cached {name} report.")
+                    reportPath[name] = path
+
+            downloadList = {
+                name: report
+                for name, report in reportList.items()
+                if name not in reportPath
+            }
+            if downloadList:
+                try:
+                    self.destinySession.downloadPath = self.saveReportToPath
+                    browser = self.destinySession.getBrowser()
+                    downloaded = self.downloadReports(browser, workspace, downloadList)
+                    if self.keepBrowserOpen:
+                        self.destinySession.reset()
+                    else:
+                        self.destinySession.quit()
+                except (WebDriverException, requests.RequestException) as error:
+                    print(f"[Error] {error}")
+                    self.destinySession.quit()
+                    return False
+
+                for name, path in downloaded.items():
+                    self.reportCache.put(self.reportKey(*reportList[name]), path)
+                    reportPath[name] = path
+
+            chunks = {}
+            for location in locationList:
+                if self.streamReportDays > 0:
+                    try:
+                        self.createSchedule(
+                            self.streamSchedule(location, reportList, reportPath),
+                            location,
+                        )
+                        continue
+                    except ReportOrderError as error:
+                        print(f"[Warning] {error}, reading it whole instead.")
+                chunks[location] = {}
+
+            # Read every report once and split its sections by center.
+            for name, (reportLocation, chunkStart, chunkEnd) in reportList.items():
+                centers = [
+                    location
+                    for location in chunks
+                    if reportLocation in [location, "All Centers"]
+                ]
+                if centers:
+                    partitions = self.splitByCenter(
+                        self.readReport(reportPath[name], chunkStart, chunkEnd)
                     )
-            browser.quit()
-        except WebDriverException:
-            browser.quit()
-            return False
-
-        for rp in reportPath:
-            self.createSchedule(rp)
+                    for location in centers:
+                        chunks[location][(chunkStart, chunkEnd)] = partitions[location]
+
+            schedules = {}
+            for location in chunks:
+                # Merge the chunks of the center back into one schedule.
+                schedules[location] = schedule = self.mergeScheduleState(
+                    location,
+                    scheduleState[location],
+                    chunks[location],
+                    startDate,
+                    endDate,
+                )
+                print(
+                    f"[Info] {location} schedule memory:\n"
+                    f"{ScheduleSchema.memoryReport(schedule)}"
+                )
+            self.createSchedules(schedules, startDate, endDate)
         return True
 
-    def createSchedule(self, reportPath: str) -> None:
-        # Read in courses from Excel
-        # 1     B   Date
-        # 3     D   Type
-        # 4     E   Start Time
-        # 6     G   End Time
-        # 9     J   Section Number
-        # 11    L   Section Title
-        # 12    M   Instructor
-        # 13    N   Building
-        # 15    P   Room
-        # 16    Q   Configuration
-        # 17    R   Technology
-        # 18    S   Section Size
-        # 20    U   Notes
-        # 22    W   Approval Status
-
-        # Read into Pandas dataframe for relevant columns
-        schedule = pd.read_excel(
-            reportPath,
-            header=6,
-            skipfooter=1,
-            usecols=[1, 15, 18, 4, 6, 11, 12, 9, 17, 20, 13, 22],
-            # parse_dates=[1, 2, 3],
-            parse_dates=[1, "Start Time", "End Time"],
-            date_format={
-                "Date": "%Y/%m/%d %H:%M:%S",
-                "Start Time": "%I:%M%p",
-                "End Time": "%I:%M%p",
-            },
-        )
-        schedule = schedule[schedule["Approval Status"] == "Final Approval"].copy()
-
-        # Determine if the Destiny report does not have any classes
-        if schedule.empty:
-            print(f"No classes found in {reportPath}")
-        else:  # Not empty, determine location and template to use
-            location = self.centerReverse[schedule.iloc[0][6]]["name"]
-            try:
-                gauth = GoogleAuth()
-                scope = [
-                    "https://www.googleapis.com/auth/drive",
-                    "https://www.googleapis.com/auth/calendar",
+    def streamSchedule(
+        self,
+        location: str,
+        reportList: Dict[str, Tuple[str, str, str]],
+        reportPath: Dict[str, str],
+    ) -> Iterator[pd.DataFrame]:
+        """Function to read the schedule of a center in chunks of streamReportDays:
+        Args:
+            location (str): Center name of the schedule.
+            reportList (dict): Center, start and end date of each report.
+            reportPath (dict): Path of each downloaded report.
+        Returns:
+            iterator: Compact schedule of each chunk, in date order.
+        """
+        reports = sorted(
+            (chunkStart, chunkEnd, reportPath[name])
+            for name, (reportLocation, chunkStart, chunkEnd) in reportList.items()
+            if reportLocation in [location, "All Centers"]
+        )
+        for chunkStart, chunkEnd, path in reports:
+            chunkDates = (chunkStart, pd.Timestamp(chunkEnd) + pd.Timedelta(days=1))
+            for chunk in ReportReader.readChunks(path, self.streamReportDays):
+                chunk = chunk[
+                    (chunk["Date"] >= chunkDates[0]) & (chunk["Date"] < chunkDates[1])
                 ]
-                gauth.credentials = ServiceAccountCredentials.from_json_keyfile_name(
-                    "service_file.json", scope
-                )
-                drive = GoogleDrive(gauth)
-                service = build("calendar", "v3", credentials=gauth.credentials)
-            except Exception as error:
-                print(f"[Error] {error}")
-
-            if location == "SFC":
-                fileName, date = self.SFCSchedule(schedule, location)
-                print(f"uploadSFCSchedule: {self.uploadSFCSchedule}")
-                print(f"attachSFCSchedule: {self.attachSFCSchedule}")
-                if self.uploadSFCSchedule:
-                    self.uploadToGoogleDrive(drive, fileName, self.SFCGDriveFolderId)
-                if self.attachSFCSchedule:
-                    self.createGoogleCalendarEvent(
-                        drive,
-                        fileName,
-                        self.SFCGDriveFolderId,
-                        service,
-                        self.SFCCalendarId,
-                        date,
-                    )
-            else:
-                fileName, date = self.GBCSchedule(schedule, location)
-                print(f"uploadGBCSchedule: {self.uploadGBCSchedule}")
-                print(f"attachGBCSchedule: {self.attachGBCSchedule}")
-                if self.uploadGBCSchedule:
-                    self.uploadToGoogleDrive(drive, fileName, self.GBCGDriveFolderId)
-                if self.attachGBCSchedule:
-                    self.createGoogleCalendarEvent(
-                        drive,
-                        fileName,
-                        self.GBCGDriveFolderId,
-                        service,
-                        self.GBCCalendarId,
-                        date,
-                    )
+                yield self.splitByCenter(ScheduleSchema.compact(chunk))[location]
 
-    def createGoogleCalendarEvent(
+    def splitByCenter(self, schedule: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Function to partition the sections of a report by their center:
+        Sections in buildings of no center are left out.
+        Args:
+            schedule (DataFrame): Sections of one or more buildings.
+        Returns:
+            dict: Sections of each center, in report order, empty if it has none.
+        """
+        locations = {
+            center["name"]: location for location, center in self.center.items()
+        }
+        centerOf = schedule["Building"].map(
+            {
+                building: locations[center["name"]]
+                for building, center in self.centerReverse.items()
+            }
+        )
+
+        partitions = {
+            location: schedule.iloc[0:0]
+            for location in self.center
+            if location != "All Centers"
+        }
+        for location, sections in schedule.groupby(centerOf, observed=True, sort=False):
+            partitions[location] = sections
+        skipped = int(centerOf.isna().sum())
+        if skipped:
+            print(f"[Info] Skipped {skipped} sections outside of the centers.")
+        return partitions
+
+    def loadScheduleState(self, location: str) -> Dict[str, Any]:
+        # Last parsed schedule of a center and the date range it covers.
+        if not self.incrementalRefresh:
+            return {}
+        try:
+            return pd.read_pickle(
+                os.path.join(
+                    self.scheduleStatePath, f"{self.center[location]['name']}.pkl"
+                )
+            )
+        except Exception:
+            return {}
+
+    def planRefresh(
+        self, state: Dict[str, Any], startDate: str, endDate: str
+    ) -> List[Tuple[str, str]]:
+        """Function to find the date ranges that have to be downloaded again:
+        Days covered by the stored schedule are reused, except for the hot
+        window (today through today + hotWindowDays) where classes still change.
+        Args:
+            state (dict): Stored schedule of the center, empty if there is none.
+            startDate (str): Start date of the requested range.
+            endDate (str): End date of the requested range.
+        Returns:
+            list: Start and end date of every range to download, in order.
+        """
+        if not self.isStateUsable(state, startDate, endDate):
+            return [(startDate, endDate)]
+        start = datetime.date.fromisoformat(startDate)
+        end = datetime.date.fromisoformat(endDate)
+        stateStart = datetime.date.fromisoformat(state["startDate"])
+        stateEnd = datetime.date.fromisoformat(state["endDate"])
+        oneDay = datetime.timedelta(days=1)
+
+        hotStart = datetime.date.today()
+        hotEnd = hotStart + datetime.timedelta(days=self.hotWindowDays)
+        ranges = []
+        day = start
+        while day <= end:
+            if not stateStart <= day <= stateEnd or hotStart <= day <= hotEnd:
+                if ranges and ranges[-1][1] == day - oneDay:
+                    ranges[-1][1] = day
+                else:
+                    ranges.append([day, day])
+            day += oneDay
+        return [(str(rangeStart), str(rangeEnd)) for rangeStart, rangeEnd in ranges]
+
+    def isStateUsable(
+        self, state: Dict[str, Any], startDate: str, endDate: str
+    ) -> bool:
+        # The stored schedule can only be extended by an overlapping or adjacent range.
+        if not state or startDate > endDate:
+            return False
+        oneDay = datetime.timedelta(days=1)
+        return (
+            datetime.date.fromisoformat(startDate)
+            <= datetime.date.fromisoformat(state["endDate"]) + oneDay
+            and datetime.date.fromisoformat(endDate)
+            >= datetime.date.fromisoformat(state["startDate"]) - oneDay
+        )
+
+    def mergeScheduleState(
+        self,
+        location: str,
+        state: Dict[str, Any],
+        chunks: Dict[Tuple[str, str], pd.DataFrame],
+        startDate: str,
+        endDate: str,
+    ) -> pd.DataFrame:
+        """Function to merge downloaded chunks into the stored schedule:
+        Args:
+            location (str): Center name of the schedule.
+            state (dict): Stored schedule of the center, empty if there is none.
+            chunks (dict): Parsed report of each downloaded (start, end) range.
+            startDate (str): Start date of the requested range.
+            endDate (str): End date of the requested range.
+        Returns:
+            DataFrame: Schedule of the requested range.
+        """
+        frames = list(chunks.values())
+        stateStart, stateEnd = startDate, endDate
+        if self.isStateUsable(state, startDate, endDate):
+            # Keep the stored rows of every day that was not downloaded again.
+            stored = ScheduleSchema.compact(state["schedule"])
+            fresh = pd.Series(False, index=stored.index)
+            for chunkStart, chunkEnd in chunks:
+                fresh |= (stored["Date"] >= chunkStart) & (
+                    stored["Date"] < pd.Timestamp(chunkEnd) + pd.Timedelta(days=1)
+                )
+            frames.insert(0, stored[~fresh])
+            stateStart = min(startDate, state["startDate"])
+            stateEnd = max(endDate, state["endDate"])
+        merged = pd.concat(frames, ignore_index=True).sort_values(
+            by="Date", kind="stable", ignore_index=True
+        )
+        # Categories of the chunks differ, so concat left them as text.
+        merged = ScheduleSchema.compact(merged)
+
+        if self.incrementalRefresh:
+            os.makedirs(self.scheduleStatePath, exist_ok=True)
+            pd.to_pickle(
+                {"startDate": stateStart, "endDate": stateEnd, "schedule": merged},
+                os.path.join(
+                    self.scheduleStatePath, f"{self.center[location]['name']}.pkl"
+                ),
+            )
+        return merged[
+            (merged["Date"] >= startDate)
+            & (merged["Date"] < pd.Timestamp(endDate) + pd.Timedelta(days=1))
+        ].reset_index(drop=True)
+
+    @staticmethod
+    def mergeDateRanges(ranges: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        # Join overlapping and adjacent date ranges, in order.
+        merged = []
+        oneDay = datetime.timedelta(days=1)
+        for rangeStart, rangeEnd in sorted(ranges):
+            if (
+                merged
+                and str(datetime.date.fromisoformat(merged[-1][1]) + oneDay)
+                >= rangeStart
+            ):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], rangeEnd))
+            else:
+                merged.append((rangeStart, rangeEnd))
+        return merged
+
+    def splitDateRange(self, startDate: str, endDate: str) -> List[Tuple[str, str]]:
+        """Function to split a date range into chunks of splitReportDays days:
+        Args:
+            startDate (str): Start date of the range.
+            endDate (str): End date of the range.
+        Returns:
+            list: Start and end date of every chunk, in order.
+        """
+        if self.splitReportDays <= 0:
+            return [(startDate, endDate)]
+
+        chunks = []
+        chunkStart = datetime.date.fromisoformat(startDate)
+        end = datetime.date.fromisoformat(endDate)
+        while chunkStart <= end:
+            chunkEnd = min(
+                chunkStart + datetime.timedelta(days=self.splitReportDays - 1), end
+            )
+            chunks.append((str(chunkStart), str(chunkEnd)))
+            chunkStart = chunkEnd + datetime.timedelta(days=1)
+        return chunks or [(startDate, endDate)]
+
+    def reportKey(self, location: str, startDate: str, endDate: str) -> str:
+        return ReportCache.key(
+            self.center[location]["campus"],
+            self.center[location]["building"],
+            startDate,
+            endDate,
+        )
+
+    def downloadReports(
+        self,
+        browser: webdriver.Chrome,
+        workspace: RunWorkspace,
+        reportList: Dict[str, Tuple[str, str, str]],
+    ) -> Dict[str, str]:
+        # Download every report (center, start date, end date) in the given mode.
+        if self.directDownload:
+            return self.downloadReportsDirect(browser, workspace, reportList)
+        with DownloadTracker(browser, workspace.path, self.downloadTimeout) as tracker:
+            if self.parallelDownload:
+                return self.downloadReportsParallel(
+                    browser, tracker, workspace, reportList
+                )
+            return self.downloadReportsSequential(
+                browser, tracker, workspace, reportList
+            )
+
+    def fillReportForm(
+        self,
+        browser: webdriver.Chrome,
+        location: str,
+        startDate: str,
+        endDate: str,
+        submit: bool = True,
+    ) -> None:
+        # Fill in the Section Schedule Daily Summary form and generate the report.
+        startDateElm = browser.find_element("id", "startDateRecordString")
+        startDateElm.send_keys(startDate)
+        endDateElm = browser.find_element("id", "endDateRecordString")
+        endDateElm.send_keys(endDate)
+        campusElm = browser.find_element("name", "scheduleBlock.campusId")
+        campusElm.send_keys(self.center[location]["campus"])
+        buildingElm = browser.find_element("name", "scheduleBlock.buildingId")
+        buildingElm.send_keys(self.center[location]["building"])
+        outputTypeElm = browser.find_element("name", "outputType")
+        outputTypeElm.send_keys("Output to XLS (Export)")
+        if submit:
+            generateReportElm = browser.find_element("id", "processReport")
+            generateReportElm.click()
+
+    def logDownload(self, name: str, download: Dict[str, Any]) -> None:
+        print(
+            f"[Info] Downloaded {name} report "
+            f"({download['bytes']:,} bytes in {download['seconds']:.1f} s) "
+            f"to {download['path']}"
+        )
+
+    def downloadReportsSequential(
+        self,
+        browser: webdriver.Chrome,
+        tracker: DownloadTracker,
+        workspace: RunWorkspace,
+        reportList: Dict[str, Tuple[str, str, str]],
+    ) -> Dict[str, str]:
+        reportPath = {}
+        for name, (location, startDate, endDate) in reportList.items():
+            # Download Destiny Report
+            self.destinySession.navigate(
+                browser,
+                f"{self.destinyUrl}/srs/reporting/sectionScheduleDailySummary.do?method=load",  # noqa: E501
+            )
+            self.fillReportForm(browser, location, startDate, endDate)
+            download = tracker.waitFor(
+                browser.current_window_handle, workspace.reportPath(name)
+            )
+            self.logDownload(name, download)
+            reportPath[name] = download["path"]
+        return reportPath
+
+    def downloadReportsParallel(
+        self,
+        browser: webdriver.Chrome,
+        tracker: DownloadTracker,
+        workspace: RunWorkspace,
+        reportList: Dict[str, Tuple[str, str, str]],
+    ) -> Dict[str, str]:
+        """Function to request the Destiny reports concurrently:
+        Up to maxParallelReports reports are in flight at once, each in its own
+        tab of the authenticated browser. Once a report is downloaded, its tab
+        requests the next one. The tab that started each download maps the
+        downloaded file back to its report.
+        Args:
+            browser (obj): Chrome webdriver already logged in to Destiny.
+            tracker (obj): Download tracker of the browser.
+            workspace (obj): Run workspace to save the reports to.
+            reportList (dict): Center name, start date and end date of each report.
+        Returns:
+            dict: Downloaded path of each report.
+        """
+        pending = list(reportList.items())
+        inFlight = []  # Report name and tab, in the order they were requested.
+        idleTabs = []
+        reportPath = {}
+        while pending or inFlight:
+            while pending and len(inFlight) < max(self.maxParallelReports, 1):
+                name, (location, startDate, endDate) = pending.pop(0)
+                if idleTabs:
+                    browser.switch_to.window(idleTabs.pop())
+                else:
+                    browser.switch_to.new_window("tab")
+                    self.destinySession.prepareTab(browser)
+                self.destinySession.navigate(
+                    browser,
+                    f"{self.destinyUrl}/srs/reporting/sectionScheduleDailySummary.do?method=load",  # noqa: E501
+                )
+                self.fillReportForm(browser, location, startDate, endDate)
+                inFlight.append((name, browser.current_window_handle))
+
+            # Wait for the oldest report, then reuse its tab.
+            name, tab = inFlight.pop(0)
+            download = tracker.waitFor(tab, workspace.reportPath(name))
+            self.logDownload(name, download)
+            reportPath[name] = download["path"]
+            idleTabs.append(tab)
+        return reportPath
+
+    def getReportForm(self, browser: webdriver.Chrome, location: str) -> Dict[str, Any]:
+        """Function to capture the report form parameters Destiny expects:
+        The form is filled in once per center exactly like a user would, and
+        the fields it would submit are read back. The form is kept for the
+        following runs.
+        Args:
+            browser (obj): Chrome webdriver already logged in to Destiny.
+            location (str): Center name to capture the report form for.
+        Returns:
+            dict: Form action URL, submitted fields, and date field names.
+        """
+        if location in self.reportForms:
+            return self.reportForms[location]
+
+        self.destinySession.navigate(
+            browser,
+            f"{self.destinyUrl}/srs/reporting/sectionScheduleDailySummary.do?method=load",  # noqa: E501
+        )
+        self.fillReportForm(browser, location, "", "", submit=False)
+        self.reportForms[location] = browser.execute_script("""
+            const button = document.getElementById("processReport");
+            const fields = Array.from(new FormData(button.form).entries());
+            if (button.name) {
+                fields.push([button.name, button.value]);
+            }
+            return {
+                action: button.form.action,
+                fields: fields.filter(field => typeof field[1] === "string"),
+                startDate: document.getElementById("startDateRecordString").name,
+                endDate: document.getElementById("endDateRecordString").name,
+            };
+            """)
+        return self.reportForms[location]
+
+    def createHttpSession(self, browser: webdriver.Chrome) -> requests.Session:
+        # Pooled HTTP session carrying the browser's authenticated Destiny cookies.
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = browser.execute_script(
+            "return navigator.userAgent;"
+        )
+        for cookie in browser.get_cookies():
+            session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+        return session
+
+    def fetchReport(
+        self,
+        session: requests.Session,
+        form: Dict[str, Any],
+        startDate: str,
+        endDate: str,
+        reportPath: str,
+    ) -> Dict[str, Any]:
+        # POST the report form and stream the XLS export to reportPath.
+        fields = []
+        for name, value in form["fields"]:
+            if name == form["startDate"]:
+                value = startDate
+            elif name == form["endDate"]:
+                value = endDate
+            fields.append((name, value))
+
+        started = time.perf_counter()
+        with session.post(
+            form["action"], data=fields, stream=True, timeout=self.downloadTimeout
+        ) as response:
+            response.raise_for_status()
+            if "attachment" not in response.headers.get(
+                "Content-Disposition", ""
+            ) and response.headers.get("Content-Type", "").startswith("text/html"):
+                raise requests.RequestException(
+                    f"Destiny returned a page instead of the report from "
+                    f"{response.url}, the session may have expired."
+                )
+            # Only keep the file once it is known to be the report.
+            with open(f"{reportPath}.part", "wb") as file:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    file.write(chunk)
+        if not ReportReader.isReport(f"{reportPath}.part"):
+            os.remove(f"{reportPath}.part")
+            raise requests.RequestException(
+                f"Destiny did not return a Section Schedule Daily Summary for "
+                f"{startDate} to {endDate}."
+            )
+        os.replace(f"{reportPath}.part", reportPath)
+        return {
+            "path": reportPath,
+            "bytes": os.path.getsize(reportPath),
+            "seconds": time.perf_counter() - started,
+        }
+
+    def downloadReportsDirect(
+        self,
+        browser: webdriver.Chrome,
+        workspace: RunWorkspace,
+        reportList: Dict[str, Tuple[str, str, str]],
+    ) -> Dict[str, str]:
+        """Function to fetch the Destiny reports straight over HTTP:
+        The report form is posted with the browser's cookies instead of typing
+        it into the page, and all reports are fetched at once.
+        Args:
+            browser (obj): Chrome webdriver already logged in to Destiny.
+            workspace (obj): Run workspace to save the reports to.
+            reportList (dict): Center name, start date and end date of each report.
+        Returns:
+            dict: Downloaded path of each report.
+        """
+        forms = {
+            location: self.getReportForm(browser, location)
+            for location, _, _ in reportList.values()
+        }
+        session = self.createHttpSession(browser)
+        with ThreadPoolExecutor(
+            max_workers=min(max(len(reportList), 1), max(self.maxParallelReports, 1))
+        ) as executor:
+            futures = {
+                name: executor.submit(
+                    self.fetchReport,
+                    session,
+                    forms[location],
+                    startDate,
+                    endDate,
+                    workspace.reportPath(name),
+                )
+                for name, (location, startDate, endDate) in reportList.items()
+            }
+            reportPath = {}
+            for name, future in futures.items():
+                download = future.result()
+                self.logDownload(name, download)
+                reportPath[name] = download["path"]
+        session.close()
+        return reportPath
+
+    def readReport(
+        self, reportPath: str, startDate: str = "", endDate: str = ""
+    ) -> pd.DataFrame:
+        # Read into Pandas dataframe for relevant columns, or reuse the
+        # schedule parsed from the same report before.
+        contentHash = ReportCache.contentHash(reportPath)
+        schedule = self.scheduleCache.get(contentHash)
+        if schedule is None:
+            schedule = ReportReader.read(reportPath)
+            self.scheduleCache.put(contentHash, schedule)
+
+        # Keep only the report's own dates, so chunks never overlap.
+        if startDate and endDate:
+            schedule = schedule[
+                (schedule["Date"] >= startDate)
+                & (schedule["Date"] < pd.Timestamp(endDate) + pd.Timedelta(days=1))
+            ]
+        return ScheduleSchema.compact(schedule)
+
+    def createSchedules(
+        self, schedules: Dict[str, pd.DataFrame], startDate: str = "", endDate: str = ""
+    ) -> None:
+        """Function to create, upload and attach the schedules of several centers:
+        With parallelRender, more than one core and more than
+        constantMemoryRows sections in all, the Excel files are created in a
+        pool of worker processes, one center each, and every one is uploaded
+        as soon as it is done. The pool is kept for later runs. The schedules
+        are sent to the workers in their compact form.
+        With skipUnchangedSchedules, schedules with the same sections as when
+        they were last created are skipped. With perDaySchedules, every day is
+        a schedule of its own, so only the days that changed are created again,
+        and days of the range that no longer have sections are removed.
+        Args:
+            schedules (dict): Compact schedule of each center.
+            startDate (str): Start date of the requested range.
+            endDate (str): End date of the requested range.
+        """
+        self.folderListings = {}
+        if self.perDaySchedules:
+            days = {}
+            for reportName, schedule in schedules.items():
+                if schedule.empty:
+                    days[reportName] = schedule
+                for day, daySchedule in schedule.groupby(schedule["Date"].dt.date):
+                    days[f"{reportName} {day.strftime('%Y-%m-%d')}"] = daySchedule
+                if startDate and endDate:
+                    self.removeEmptyDays(
+                        self.center[reportName]["name"],
+                        set(schedule["Date"].dt.strftime("%Y-%m-%d")),
+                        startDate,
+                        endDate,
+                    )
+            schedules = days
+
+        jobs = {}
+        for reportName, schedule in schedules.items():
+            if schedule.empty:
+                print(f"No classes found in {reportName}")
+                continue
+            location = self.centerReverse[schedule.iloc[0][6]]["name"]
+            scheduleHash = ""
+            if self.skipUnchangedSchedules:
+                scheduleHash = self.scheduleHash(schedule)
+                if self.scheduleUnchanged(location, schedule, scheduleHash):
+                    print(f"[Info] {reportName} schedule is unchanged, skipping.")
+                    continue
+            jobs[reportName] = (location, schedule, scheduleHash)
+        rows = sum(len(schedule.index) for _, schedule, _ in jobs.values())
+        # Starting a worker takes longer than rendering a small schedule.
+        if (
+            not self.parallelRender
+            or len(jobs) < 2
+            or (os.cpu_count() or 1) < 2
+            or rows <= self.constantMemoryRows
+        ):
+            for reportName, (location, schedule, scheduleHash) in jobs.items():
+                self.createSchedule(schedule, reportName, scheduleHash)
+            return
+
+        if self.renderPool is None:
+            # Kept for later runs, so the workers only start and import once.
+            self.renderPool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        settings = {name: getattr(self, name) for name in self.renderSettings}
+        futures = {
+            self.renderPool.submit(renderSchedule, settings, schedule, location): (
+                location,
+                scheduleHash,
+            )
+            for location, schedule, scheduleHash in jobs.values()
+        }
+        for future in as_completed(futures):
+            try:
+                fileName, date, buffer = future.result()
+            except SheetsWriteError as error:
+                print(f"[Error] {error}")
+                continue
+            if buffer is not None:
+                self.workbookBuffers[fileName] = buffer
+            location, scheduleHash = futures[future]
+            self.publishSchedule(location, fileName, date, scheduleHash)
+
+    def removeEmptyDays(
+        self, location: str, dates: Set[str], startDate: str, endDate: str
+    ) -> None:
+        """Function to remove the per-day schedules of days without sections:
+        Days of the range with a recorded hash but no sections any more have
+        their file or Sheet and their calendar event removed, and their hash
+        forgotten.
+        Args:
+            location (str): Center code, GBC or SFC.
+            dates (set): Dates that have sections, as YYYY-MM-DD.
+            startDate (str): Start date of the requested range.
+            endDate (str): End date of the requested range.
+        """
+        for key in self.loadScheduleHashes():
+            center, _, date = key.partition(" ")
+            if center == location and startDate <= date <= endDate:
+                if date not in dates:
+                    self.removeSchedule(location, date)
+
+    def removeSchedule(self, location: str, date: str) -> None:
+        """Function to remove the schedule of a day and its calendar event:
+        Args:
+            location (str): Center code, GBC or SFC.
+            date (str): Date of the schedule, as YYYY-MM-DD.
+        """
+        fileName = self.scheduleFileName(
+            location, datetime.datetime.strptime(date, "%Y-%m-%d")
+        )
+        print(f"[Info] {fileName[:-5]} no longer has classes, removing it.")
+        try:
+            os.remove(f"{self.saveReportToPath}\\{fileName}")
+        except FileNotFoundError:
+            pass
+        except OSError as error:
+            print(f"[Warning] Could not remove {fileName}: {error}")
+            return
+
+        if location == "SFC":
+            attach, calendarId = self.attachSFCSchedule, self.SFCCalendarId
+            folderId = self.SFCGDriveFolderId
+        else:
+            attach, calendarId = self.attachGBCSchedule, self.GBCCalendarId
+            folderId = self.GBCGDriveFolderId
+        try:
+            if self.uploadsSchedule(location) or attach:
+                drive, service = self.googleServices()
+            if self.uploadsSchedule(location):
+                file = self.getFile(drive, fileName[:-5], folderId)
+                if file:
+                    file.Trash()
+            if attach:
+                event = self.findCalendarEvent(service, calendarId, fileName[:-5], date)
+                if event:
+                    service.events().delete(
+                        calendarId=calendarId, eventId=event["id"]
+                    ).execute()
+        except Exception as error:
+            print(f"[Warning] Could not remove {fileName[:-5]}: {error}")
+            return
+        self.saveScheduleHash(location, date, "")
+
+    def createSchedule(
+        self, schedule: Any, reportName: str, scheduleHash: str = ""
+    ) -> None:
+        # Determine if the Destiny report does not have any classes
+        chunks = ScheduleSchema.chunks(schedule)
+        firstChunk = next(chunks, None)
+        if firstChunk is None:
+            print(f"No classes found in {reportName}")
+        else:  # Not empty, determine location and template to use
+            location = self.centerReverse[firstChunk.iloc[0][6]]["name"]
+            schedule = itertools.chain([firstChunk], chunks)
+            try:
+                if location == "SFC":
+                    fileName, date = self.SFCSchedule(schedule, location)
+                else:
+                    fileName, date = self.GBCSchedule(schedule, location)
+            except SheetsWriteError as error:
+                print(f"[Error] {error}")
+                return
+            self.publishSchedule(location, fileName, date, scheduleHash)
+
+    def publishSchedule(
+        self, location: str, fileName: str, date: str, scheduleHash: str = ""
+    ) -> None:
+        """Function to upload a created schedule and attach it to the calendar:
+        Args:
+            location (str): Center code, GBC or SFC.
+            fileName (str): File name of the schedule in saveReportToPath.
+            date (str): First date of the schedule.
+            scheduleHash (str): Hash of the schedule to record once it is
+                uploaded and attached, or "" to not record it.
+        """
+        try:
+            drive, service = self.googleServices()
+        except Exception as error:
+            print(f"[Error] {error}")
+
+        properties = {"scheduleHash": scheduleHash} if scheduleHash else {}
+        # Whether every upload and calendar event succeeded.
+        published = True
+
+        buffer = self.workbookBuffers.pop(fileName, None)
+        if buffer is not None and self.saveLocalCopy:
+            # Save the local copy while the workbook is uploaded.
+            threading.Thread(
+                target=self.saveWorkbookCopy, args=(fileName, buffer.getvalue())
+            ).start()
+
+        if location == "SFC":
+            print(f"uploadSFCSchedule: {self.uploadSFCSchedule}")
+            print(f"attachSFCSchedule: {self.attachSFCSchedule}")
+            if self.uploadSFCSchedule and not self.sheetsFolder(location):
+                if not self.uploadToGoogleDrive(
+                    drive,
+                    fileName,
+                    self.SFCGDriveFolderId,
+                    content=buffer,
+                    properties=properties,
+                ):
+                    published = False
+            if self.attachSFCSchedule:
+                if not self.createGoogleCalendarEvent(
+                    drive,
+                    fileName,
+                    self.SFCGDriveFolderId,
+                    service,
+                    self.SFCCalendarId,
+                    date,
+                ):
+                    published = False
+        else:
+            print(f"uploadGBCSchedule: {self.uploadGBCSchedule}")
+            print(f"attachGBCSchedule: {self.attachGBCSchedule}")
+            if self.uploadGBCSchedule and not self.sheetsFolder(location):
+                if not self.uploadToGoogleDrive(
+                    drive,
+                    fileName,
+                    self.GBCGDriveFolderId,
+                    content=buffer,
+                    properties=properties,
+                ):
+                    published = False
+            if self.attachGBCSchedule:
+                if not self.createGoogleCalendarEvent(
+                    drive,
+                    fileName,
+                    self.GBCGDriveFolderId,
+                    service,
+                    self.GBCCalendarId,
+                    date,
+                ):
+                    published = False
+
+        if scheduleHash and not published:
+            print(f"[Warning] {fileName[:-5]} was not published, its hash is not kept.")
+        elif scheduleHash:
+            if self.sheetsFolder(location):
+                self.setFileProperties(
+                    drive, fileName[:-5], self.sheetsFolder(location), properties
+                )
+            self.saveScheduleHash(location, date, scheduleHash)
+
+    def googleServices(self) -> Tuple[GoogleDrive, Resource]:
+        # Google Drive and Google Calendar services of the service account.
+        clients = GoogleClients.get()
+        return clients.drive(), clients.resource("calendar", "v3")
+
+    def scheduleHash(self, schedule: pd.DataFrame) -> str:
+        """Function to hash the sections of a schedule and how it is created:
+        Rows are hashed one by one and sorted, so the hash does not depend on
+        the order of the sections in the report.
+        Args:
+            schedule (DataFrame): Compact schedule of a center.
+        Returns:
+            str: Hex SHA-256 hash of the schedule.
+        """
+        rows = np.sort(pd.util.hash_pandas_object(schedule, index=False).to_numpy())
+        settings = {name: getattr(self, name) for name in self.renderSettings}
+        digest = hashlib.sha256(
+            json.dumps(
+                [self.scheduleHashVersion, list(schedule.columns), settings],
+                sort_keys=True,
+            ).encode()
+        )
+        digest.update(rows.tobytes())
+        return digest.hexdigest()
+
+    def scheduleUnchanged(
+        self, location: str, schedule: pd.DataFrame, scheduleHash: str
+    ) -> bool:
+        """Function to check whether a schedule was already created as it is:
+        The hash is looked up in scheduleStatePath and in the properties of
+        the schedule in Google Drive. An uploaded schedule only counts as
+        unchanged while its file is still in Google Drive, which is checked
+        in a listing of the folder made once per run.
+        Args:
+            location (str): Center code, GBC or SFC.
+            schedule (DataFrame): Compact schedule of the center.
+            scheduleHash (str): Hash of the schedule.
+        Returns:
+            bool: Whether the schedule is unchanged.
+        """
+        firstDate = schedule["Date"].min().date()
+        date = firstDate.strftime("%Y-%m-%d")
+        fileName = self.scheduleFileName(location, firstDate)
+        stored = self.loadScheduleHashes().get(f"{location} {date}") == scheduleHash
+        if not self.uploadsSchedule(location):
+            # Only the local file is created, so it has to be there still.
+            return stored and os.path.exists(f"{self.saveReportToPath}\\{fileName}")
+
+        folderId = (
+            self.SFCGDriveFolderId if location == "SFC" else self.GBCGDriveFolderId
+        )
+        try:
+            drive = self.googleServices()[0]
+            file = self.folderFiles(drive, folderId).get(fileName[:-5], {})
+        except Exception as error:
+            print(f"[Warning] Could not check {fileName[:-5]} in Google Drive: {error}")
+            return False
+        if stored and file:
+            # Recorded here, and the file was not removed from Google Drive since.
+            return True
+        remote = {prop["key"]: prop.get("value") for prop in file.get("properties", [])}
+        if remote.get("scheduleHash") != scheduleHash:
+            return False
+        self.saveScheduleHash(location, date, scheduleHash)
+        return True
+
+    def scheduleHashesPath(self) -> str:
+        return os.path.join(self.scheduleStatePath, "ScheduleHashes.json")
+
+    def loadScheduleHashes(self) -> Dict[str, str]:
+        # Hash of the schedule last created for each center and first date.
+        try:
+            with open(self.scheduleHashesPath()) as hashes:
+                return json.load(hashes)
+        except (OSError, ValueError):
+            return {}
+
+    def saveScheduleHash(self, location: str, date: str, scheduleHash: str) -> None:
+        # An empty hash forgets the schedule of the center and date.
+        hashes = self.loadScheduleHashes()
+        if scheduleHash:
+            hashes[f"{location} {date}"] = scheduleHash
+        else:
+            hashes.pop(f"{location} {date}", None)
+        try:
+            os.makedirs(self.scheduleStatePath, exist_ok=True)
+            with open(self.scheduleHashesPath(), "w") as output:
+                json.dump(hashes, output, indent=1, sort_keys=True)
+        except OSError as error:
+            print(f"[Warning] Could not save the schedule hash: {error}")
+
+    def setFileProperties(
+        self,
+        drive: GoogleDrive,
+        fileName: str,
+        parentFolderId: str,
+        properties: Dict[str, str],
+    ) -> None:
+        # Set private properties of a file in Google Drive, without its content.
+        file = self.getFile(drive, fileName, parentFolderId)
+        if file:
+            file["properties"] = self.driveProperties(properties)
+            file.Upload()
+
+    @staticmethod
+    def driveProperties(properties: Dict[str, str]) -> List[Dict[str, str]]:
+        # Drive v2 properties, private to the service account.
+        return [
+            {"key": key, "value": value, "visibility": "PRIVATE"}
+            for key, value in properties.items()
+        ]
+
+    def createGoogleCalendarEvent(
         self,
         drive: GoogleDrive,
         fileName: str,
@@ -687,7 +3264,7 @@ class Ui_mainWindow(object):
         service: Resource,
         calendarId: str,
         date: str,
-    ) -> None:
+    ) -> bool:
         """Function to create a Google Calendar Event and attach Google Sheets to:
         Args:
             drive (obj): Google Drive authenticated class object.
@@ -696,6 +3273,8 @@ class Ui_mainWindow(object):
             service (obj): Google Calendar service to interact with the API.
             calenderId (str): Google Calendar ID to create the event in.
             date (str): Date of the event.
+        Returns:
+            bool: Whether the event was created or updated.
         """
         # Find the file's metadata in Google Drive under the parent folder.
         timeout = 0
@@ -709,30 +3288,10 @@ class Ui_mainWindow(object):
 
         if not file:
             print(f"[Warning] Could not find {fileName[:-5]} in Google Drive.")
-            return None
+            return False
 
         # Find whether an event already exists.
-        event_start = (
-            datetime.datetime.strptime(f"{date}", "%Y-%m-%d").isoformat() + "Z"
-        )
-        events_result = (
-            service.events()
-            .list(
-                calendarId=calendarId,
-                timeMin=event_start,
-                maxResults=100,
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
-        )
-        events = events_result.get("items", [])
-
-        existingEvent = {}
-        for event in events:
-            if event["summary"] == fileName[:-5]:
-                existingEvent = event
-                break
+        existingEvent = self.findCalendarEvent(service, calendarId, fileName[:-5], date)
 
         # Create the event body payload, including attachment information.
         body = {
@@ -765,22 +3324,51 @@ class Ui_mainWindow(object):
 
         # If the event already exists, update the existing event.
         if existingEvent:
-            event = (
-                service.events()
-                .update(
-                    calendarId=calendarId,
-                    eventId=existingEvent["id"],
-                    body=body,
-                    supportsAttachments=True,
-                )
-                .execute()
-            )
+            service.events().update(
+                calendarId=calendarId,
+                eventId=existingEvent["id"],
+                body=body,
+                supportsAttachments=True,
+            ).execute()
         else:  # Event does not exist. Create a new event.
-            event = (
-                service.events()
-                .insert(calendarId=calendarId, body=body, supportsAttachments=True)
-                .execute()
+            service.events().insert(
+                calendarId=calendarId, body=body, supportsAttachments=True
+            ).execute()
+        return True
+
+    def findCalendarEvent(
+        self, service: Resource, calendarId: str, summary: str, date: str
+    ) -> Dict[str, Any]:
+        # Retrieve the event of a schedule from its date on. Return event.
+        event_start = (
+            datetime.datetime.strptime(f"{date}", "%Y-%m-%d").isoformat() + "Z"
+        )
+        events_result = (
+            service.events()
+            .list(
+                calendarId=calendarId,
+                timeMin=event_start,
+                maxResults=100,
+                singleEvents=True,
+                orderBy="startTime",
             )
+            .execute()
+        )
+        for event in events_result.get("items", []):
+            if event["summary"] == summary:
+                return event
+        return {}
+
+    def folderFiles(self, drive: GoogleDrive, folderId: str) -> Dict[str, Any]:
+        # Files of a Google Drive folder by title, listed once per run.
+        if folderId not in self.folderListings:
+            files = {}
+            for file in drive.ListFile(
+                {"q": f"'{folderId}' in parents and trashed=false"}
+            ).GetList():
+                files.setdefault(file["title"], file)
+            self.folderListings[folderId] = files
+        return self.folderListings[folderId]
 
     def getFile(self, drive: GoogleDrive, fileName: str, parentFolderId: str) -> Any:
         # Retrieve the file's metadata under the parent folder. Return file.
@@ -798,6 +3386,8 @@ class Ui_mainWindow(object):
         fileName: str,
         folderId: str = "",
         folderName: str = "",
+        content: Any = None,
+        properties: Dict[str, str] = None,
     ) -> int:
         if not fileName:
             print("[Error] No file name given. Nothing to upload.")
@@ -837,28 +3427,123 @@ class Ui_mainWindow(object):
                 )
 
             # Set file to upload and convert to Google Doc type.
-            file.SetContentFile(f"{self.saveReportToPath}\\{fileName}")
+            if content is None:
+                file.SetContentFile(f"{self.saveReportToPath}\\{fileName}")
+            else:  # Upload the workbook rendered in memory.
+                content.seek(0)
+                file.content = content
+                file["mimeType"] = self.xlsxMimeType
+            if properties:
+                file["properties"] = self.driveProperties(properties)
             file.Upload({"convert": True})
         else:
             return 0
 
         return 1
 
-    def GBCSchedule(self, schedule: pd.DataFrame, location: str) -> Tuple[str, str]:
-        # Sort the schedule.
-        sortedSchedule = schedule.sort_values(by=["Date", "Start Time", "Room"])
-        sortedSchedule = sortedSchedule.fillna("")
-        dateList = sortedSchedule["Date"].dt.date.unique()
+    @staticmethod
+    def scheduleFileName(location: str, date: datetime.date) -> str:
+        # File name of the schedule of a center starting on the given date.
+        return f"{location} Schedule {date.strftime('%Y-%m-%d %A')}.xlsx"
 
-        # Create the Excel file to write to.
-        fileName = (
-            f"{location} Schedule {dateList[0].strftime('%Y-%m-%d')} "
-            f"{dateList[0].strftime('%A')}.xlsx"
+    def saveWorkbookCopy(self, fileName: str, content: bytes) -> None:
+        # Save a copy of a workbook rendered in memory to saveReportToPath.
+        try:
+            with open(f"{self.saveReportToPath}\\{fileName}", "wb") as output:
+                output.write(content)
+        except OSError as error:
+            print(f"[Warning] Could not save a copy of {fileName}: {error}")
+
+    def sheetsFolder(self, location: str) -> str:
+        """Function to find where a center's schedule is written to Google Sheets:
+        Args:
+            location (str): Center code, GBC or SFC.
+        Returns:
+            str: Google Drive folder ID, or "" to write an xlsx file instead.
+        """
+        folderId = (
+            self.SFCGDriveFolderId if location == "SFC" else self.GBCGDriveFolderId
         )
+        return folderId if self.sheetsOutput and self.uploadsSchedule(location) else ""
+
+    def uploadsSchedule(self, location: str) -> bool:
+        # Whether the schedule of a center is uploaded to Google Drive.
+        if location == "SFC":
+            return self.uploadSFCSchedule and bool(self.SFCGDriveFolderId)
+        return self.uploadGBCSchedule and bool(self.GBCGDriveFolderId)
+
+    def openWorkbook(self, fileName: str, location: str, schedule: Any) -> Any:
+        """Function to open the workbook a schedule is rendered into:
+        Args:
+            fileName (str): File name of the schedule.
+            location (str): Center code, GBC or SFC.
+            schedule (DataFrame or iterator): Schedule to be written.
+        Returns:
+            obj: xlsxwriter workbook in saveReportToPath or in memory, to be
+                uploaded from workbookBuffers, or a SheetsWorkbook.
+        """
+        folderId = self.sheetsFolder(location)
+        if folderId:
+            return SheetsWorkbook(fileName[:-5], folderId)
+        output = f"{self.saveReportToPath}\\{fileName}"
+        if self.inMemoryUpload and self.uploadsSchedule(location):
+            output = self.workbookBuffers[fileName] = io.BytesIO()
         writer = pd.ExcelWriter(
-            f"{self.saveReportToPath}\\{fileName}", engine="xlsxwriter"
+            output,
+            engine="xlsxwriter",
+            engine_kwargs=self.workbookOptions(schedule),
+        )
+        return writer.book
+
+    def workbookOptions(self, schedule: Any) -> Dict[str, Any]:
+        """Function to choose the xlsxwriter options of a schedule workbook:
+        Schedules of more than constantMemoryRows sections, and streamed ones
+        of unknown length, are written in constant_memory mode. Each row is
+        then flushed to disk once the next one is started, instead of keeping
+        every cell until the workbook is closed.
+        Args:
+            schedule (DataFrame or iterator): Schedule to be written.
+        Returns:
+            dict: Keyword arguments of the xlsxwriter Workbook.
+        """
+        constantMemory = (
+            not isinstance(schedule, pd.DataFrame)
+            or len(schedule.index) > self.constantMemoryRows
+        )
+        return {"options": {"constant_memory": constantMemory}}
+
+    @staticmethod
+    def timeBlocks(value: str, default: str) -> List[int]:
+        """Function to read the times where the blocks of a day start:
+        The first block always starts at midnight.
+        Args:
+            value (str): Comma separated start times, e.g. "12:00,17:00".
+            default (str): Start times to use when value is not valid.
+        Returns:
+            list: Start of every block after the first, in minutes since midnight.
+        """
+        try:
+            times = [
+                datetime.datetime.strptime(time.strip(), "%H:%M")
+                for time in value.split(",")
+                if time.strip()
+            ]
+        except ValueError:
+            print(f"[Error] Invalid time blocks {value!r}, using {default!r}.")
+            return Ui_mainWindow.timeBlocks(default, default)
+        return sorted({time.hour * 60 + time.minute for time in times} - {0})
+
+    def GBCSchedule(self, schedule: pd.DataFrame, location: str) -> Tuple[str, str]:
+        # Sort the schedule one chunk at a time, as the chunks are rendered.
+        sortedChunks = ScheduleSchema.sortedChunks(
+            schedule, ["Date", "Start Time", "Room"]
         )
-        workbook = writer.book
+        sortedSchedule = next(sortedChunks)
+        dateList = sortedSchedule["Date"].dt.date.unique()
+
+        # Create the Excel file to write to.
+        fileName = self.scheduleFileName(location, dateList[0])
+        workbook = self.openWorkbook(fileName, location, schedule)
 
         # Set the Excel workbook formatting
         worksheet = workbook.add_worksheet(location)
@@ -886,132 +3571,13 @@ class Ui_mainWindow(object):
         worksheet.set_column("I:I", 18.57)  # Column I (Technology) width
         worksheet.set_column("J:J", 64)  # Column J (Notes) width
 
-        locationFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#000000",
-                "bg_color": "#FFC000",
-            }
-        )
-
-        genFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#C00000",
-                "bg_color": "#FDE9D9",
-            }
-        )
-
-        headerFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "bottom": 2,
-                "bottom_color": "#000000",
-            }
-        )
-
-        bodyFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": False,
-                "valign": "top",
-                "text_wrap": False,
-                "font_color": "#000000",
-            }
-        )
-
-        daySeparator = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#000000",
-                "bg_color": "#00B050",
-            }
-        )
-
-        roomFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "align": "right",
-                "font_color": "#C00000",
-            }
-        )
-
-        roomFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#C00000",
-            }
-        )
-
-        laptopReadyFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "italic": True,
-                "text_wrap": False,
-                "font_color": "#0070C0",
-            }
-        )
-
-        instructorFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": False,
-                "text_wrap": False,
-                "font_color": "#C00000",
-            }
-        )
+        styles = ScheduleStyles(workbook)
 
-        # AM
-        amFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": False,
-                "text_wrap": False,
-                "font_color": "#FF0000",
-                "bg_color": "#DAEEF3",
-            }
-        )
-
-        # Computer Lab
-        labFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#FF0000",
-                "bg_color": "#FFFF00",
-            }
-        )
-
-        worksheet.write(0, 0, f"{sortedSchedule.iloc[0][6]}", locationFormat)
-        worksheet.write(0, 1, "", locationFormat)
-        worksheet.write(0, 2, "", locationFormat)
-        worksheet.write(0, 3, "", locationFormat)
-        worksheet.write(0, 4, "", locationFormat)
+        worksheet.write(0, 0, f"{sortedSchedule.iloc[0][6]}", styles["location"])
+        worksheet.write(0, 1, "", styles["location"])
+        worksheet.write(0, 2, "", styles["location"])
+        worksheet.write(0, 3, "", styles["location"])
+        worksheet.write(0, 4, "", styles["location"])
 
         worksheet.write(
             0,
@@ -1020,7 +3586,7 @@ class Ui_mainWindow(object):
                 f"Report generated as of {dateList[0].strftime('%A')}, "
                 f"{dateList[0].strftime('%B %d, %Y').replace(' 0', ' ')}"
             ),
-            genFormat,
+            styles["generated"],
         )
         for col_num, value in enumerate(
             [
@@ -1036,285 +3602,30 @@ class Ui_mainWindow(object):
                 "Notes",
             ]
         ):
-            worksheet.write(1, col_num, value, headerFormat)
+            worksheet.write(1, col_num, value, styles["header"])
         excelRow = 2
-        # Loop through each day
-        for i in range(0, len(dateList)):
-            singleDaySched = sortedSchedule.loc[
-                sortedSchedule["Date"].dt.date == dateList[i], :
-            ]
-
-            morningBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("00:00", "12:00", inclusive="left")
-                .reset_index()
-            )
-            afternoonBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("12:00", "17:00", inclusive="left")
-                .reset_index()
-            )
-            eveningBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("17:00", "00:00", inclusive="left")
-                .reset_index()
-            )
-
-            morningBlock["Start Time"] = morningBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            morningBlock["End Time"] = morningBlock["End Time"].dt.strftime("%I:%M %p")
-            afternoonBlock["Start Time"] = afternoonBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            afternoonBlock["End Time"] = afternoonBlock["End Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            eveningBlock["Start Time"] = eveningBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            eveningBlock["End Time"] = eveningBlock["End Time"].dt.strftime("%I:%M %p")
-
-            worksheet.write(
-                excelRow,
-                0,
-                (
-                    f"{dateList[i].strftime('%A')}, "
-                    f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                ),
-                daySeparator,
-            )
-            worksheet.write_number(excelRow, 3, len(singleDaySched.index), amFormat)
-            excelRow += 1
-            if not morningBlock.empty:
-                for idx, row in morningBlock.iterrows():
-                    worksheet.write(
-                        excelRow,
-                        0,
-                        (
-                            f"{dateList[i].strftime('%A')}, "
-                            f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                        ),
-                        bodyFormat,
-                    )
-                    if location == "GBC" and row["Room"] == "Classroom 201":
-                        worksheet.write_number(
-                            excelRow,
-                            1,
-                            int(row["Room"].replace("Classroom ", "")),
-                            labFormat,
-                        )
-                    else:
-                        if (
-                            "Conference Room" in row["Room"]
-                            or "Conference Room" in row["Room"]
-                        ):
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Conference Room ", "CR"),
-                                roomFormat,
-                            )
-                        elif row["Room"].replace("Classroom ", "").isdigit():
-                            worksheet.write_number(
-                                excelRow,
-                                1,
-                                int(row["Room"].replace("Classroom ", "")),
-                                roomFormat,
-                            )
-                        else:
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Classroom ", "").lstrip("0"),
-                                roomFormat,
-                            )
-                    worksheet.write(excelRow, 2, row["Section Size"], bodyFormat)
-                    if "AM" in row["Start Time"]:
-                        worksheet.write(
-                            excelRow, 3, row["Start Time"].lstrip("0"), amFormat
-                        )
-                    else:
-                        worksheet.write(
-                            excelRow, 3, row["Start Time"].lstrip("0"), bodyFormat
-                        )
-                    if "AM" in row["End Time"]:
-                        worksheet.write(
-                            excelRow, 4, row["End Time"].lstrip("0"), amFormat
-                        )
-                    else:
-                        worksheet.write(
-                            excelRow, 4, row["End Time"].lstrip("0"), bodyFormat
-                        )
-                    if "Boot Camp" in row["Section Title"]:
-                        worksheet.write(
-                            excelRow, 5, row["Section Title"], laptopReadyFormat
-                        )
-                    else:
-                        worksheet.write(excelRow, 5, row["Section Title"], bodyFormat)
-                    if row["Instructor"] == "Instructor To Be Announced":
-                        worksheet.write(excelRow, 6, "TBA", instructorFormat)
-                    elif not pd.isnull(row["Instructor"]):
-                        worksheet.write(
-                            excelRow, 6, row["Instructor"], instructorFormat
-                        )
-                    worksheet.write(excelRow, 7, row["Section Number"], bodyFormat)
-                    worksheet.write(excelRow, 8, row["Technology"], bodyFormat)
-                    worksheet.write(excelRow, 9, row["Notes"], bodyFormat)
-                    excelRow += 1
-
-            if not afternoonBlock.empty:
-                for idx, row in afternoonBlock.iterrows():
-                    worksheet.write(
-                        excelRow,
-                        0,
-                        (
-                            f"{dateList[i].strftime('%A')}, "
-                            f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                        ),
-                        bodyFormat,
-                    )
-                    if location == "GBC" and row["Room"] == "Classroom 201":
-                        worksheet.write_number(
-                            excelRow,
-                            1,
-                            int(row["Room"].replace("Classroom ", "")),
-                            labFormat,
-                        )
-                    else:
-                        if (
-                            "Conference Room" in row["Room"]
-                            or "Conference Room" in row["Room"]
-                        ):
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Conference Room ", "CR"),
-                                roomFormat,
-                            )
-                        elif row["Room"].replace("Classroom ", "").isdigit():
-                            worksheet.write_number(
-                                excelRow,
-                                1,
-                                int(row["Room"].replace("Classroom ", "")),
-                                roomFormat,
-                            )
-                        else:
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Classroom ", "").lstrip("0"),
-                                roomFormat,
-                            )
-                    worksheet.write(excelRow, 2, row["Section Size"], bodyFormat)
-                    worksheet.write(
-                        excelRow, 3, row["Start Time"].lstrip("0"), bodyFormat
-                    )
-                    worksheet.write(
-                        excelRow, 4, row["End Time"].lstrip("0"), bodyFormat
-                    )
-                    if "Boot Camp" in row["Section Title"]:
-                        worksheet.write(
-                            excelRow, 5, row["Section Title"], laptopReadyFormat
-                        )
-                    else:
-                        worksheet.write(excelRow, 5, row["Section Title"], bodyFormat)
-                    if row["Instructor"] == "Instructor To Be Announced":
-                        worksheet.write(excelRow, 6, "TBA", instructorFormat)
-                    elif not pd.isnull(row["Instructor"]):
-                        worksheet.write(
-                            excelRow, 6, row["Instructor"], instructorFormat
-                        )
-                    worksheet.write(excelRow, 7, row["Section Number"], bodyFormat)
-                    worksheet.write(excelRow, 8, row["Technology"], bodyFormat)
-                    worksheet.write(excelRow, 9, row["Notes"], bodyFormat)
-                    excelRow += 1
-
-            if not eveningBlock.empty:
-                for idx, row in eveningBlock.iterrows():
-                    worksheet.write(
-                        excelRow,
-                        0,
-                        (
-                            f"{dateList[i].strftime('%A')}, "
-                            f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                        ),
-                        bodyFormat,
-                    )
-                    if location == "GBC" and row["Room"] == "Classroom 201":
-                        worksheet.write_number(
-                            excelRow,
-                            1,
-                            int(row["Room"].replace("Classroom ", "")),
-                            labFormat,
-                        )
-                    else:
-                        if (
-                            "Conference Room" in row["Room"]
-                            or "Conference Room" in row["Room"]
-                        ):
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Conference Room ", "CR"),
-                                roomFormat,
-                            )
-                        elif row["Room"].replace("Classroom ", "").isdigit():
-                            worksheet.write_number(
-                                excelRow,
-                                1,
-                                int(row["Room"].replace("Classroom ", "")),
-                                roomFormat,
-                            )
-                        else:
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Classroom ", "").lstrip("0"),
-                                roomFormat,
-                            )
-                    worksheet.write(excelRow, 2, row["Section Size"], bodyFormat)
-                    worksheet.write(
-                        excelRow, 3, row["Start Time"].lstrip("0"), bodyFormat
-                    )
-                    worksheet.write(
-                        excelRow, 4, row["End Time"].lstrip("0"), bodyFormat
-                    )
-                    if "Boot Camp" in row["Section Title"]:
-                        worksheet.write(
-                            excelRow, 5, row["Section Title"], laptopReadyFormat
-                        )
-                    else:
-                        worksheet.write(excelRow, 5, row["Section Title"], bodyFormat)
-                    if row["Instructor"] == "Instructor To Be Announced":
-                        worksheet.write(excelRow, 6, "TBA", instructorFormat)
-                    elif not pd.isnull(row["Instructor"]):
-                        worksheet.write(
-                            excelRow, 6, row["Instructor"], instructorFormat
-                        )
-                    worksheet.write(excelRow, 7, row["Section Number"], bodyFormat)
-                    worksheet.write(excelRow, 8, row["Technology"], bodyFormat)
-                    worksheet.write(excelRow, 9, row["Notes"], bodyFormat)
-                    excelRow += 1
+        # Loop through each chunk of the schedule, then each day of it
+        for sortedSchedule in itertools.chain([sortedSchedule], sortedChunks):
+            excelRow = ScheduleRows(
+                sortedSchedule,
+                self.timeBlocks(self.GBCTimeBlocks, "12:00,17:00"),
+                lambda room: location == "GBC" and room == "Classroom 201",
+            ).write(worksheet, styles, excelRow)
 
         workbook.close()
         return fileName, dateList[0].strftime("%Y-%m-%d")
 
     def SFCSchedule(self, schedule: pd.DataFrame, location: str) -> Tuple[str, str]:
-        # Sort the schedule.
-        sortedSchedule = schedule.sort_values(by=["Date", "Room", "Start Time"])
-        sortedSchedule = sortedSchedule.fillna("")
+        # Sort the schedule one chunk at a time, as the chunks are rendered.
+        sortedChunks = ScheduleSchema.sortedChunks(
+            schedule, ["Date", "Room", "Start Time"]
+        )
+        sortedSchedule = next(sortedChunks)
         dateList = sortedSchedule["Date"].dt.date.unique()
 
         # Create the Excel file to write to.
-        fileName = (
-            f"{location} Schedule {dateList[0].strftime('%Y-%m-%d')} "
-            f"{dateList[0].strftime('%A')}.xlsx"
-        )
-        writer = pd.ExcelWriter(
-            f"{self.saveReportToPath}\\{fileName}", engine="xlsxwriter"
-        )
-        workbook = writer.book
+        fileName = self.scheduleFileName(location, dateList[0])
+        workbook = self.openWorkbook(fileName, location, schedule)
 
         # Set the Excel workbook formatting.
         worksheet = workbook.add_worksheet(location)
@@ -1342,133 +3653,13 @@ class Ui_mainWindow(object):
         worksheet.set_column("I:I", 18.57)  # Column H Technology) width
         worksheet.set_column("J:J", 64)  # Column H (Notes) width
 
-        locationFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#000000",
-                "bg_color": "#FFC000",
-            }
-        )
-
-        genFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#C00000",
-                "bg_color": "#FDE9D9",
-            }
-        )
-
-        headerFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                # 'valign': 'vcenter',
-                "bottom": 2,
-                "bottom_color": "#000000",
-            }
-        )
-
-        bodyFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": False,
-                "valign": "top",
-                "text_wrap": False,
-                "font_color": "#000000",
-            }
-        )
-
-        daySeparator = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#000000",
-                "bg_color": "#00B050",
-            }
-        )
-
-        roomFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "align": "right",
-                "font_color": "#C00000",
-            }
-        )
-
-        roomFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#C00000",
-            }
-        )
-
-        laptopReadyFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "italic": True,
-                "text_wrap": False,
-                "font_color": "#0070C0",
-            }
-        )
-
-        instructorFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": False,
-                "text_wrap": False,
-                "font_color": "#C00000",
-            }
-        )
+        styles = ScheduleStyles(workbook)
 
-        # AM
-        amFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": False,
-                "text_wrap": False,
-                "font_color": "#FF0000",
-                "bg_color": "#DAEEF3",
-            }
-        )
-
-        # Computer Lab
-        labFormat = workbook.add_format(
-            {
-                "font_name": "Calibri",
-                "font_size": 11,
-                "bold": True,
-                "text_wrap": False,
-                "font_color": "#FF0000",
-                "bg_color": "#FFFF00",
-            }
-        )
-
-        worksheet.write(0, 0, f"{sortedSchedule.iloc[0][6]}", locationFormat)
-        worksheet.write(0, 1, "", locationFormat)
-        worksheet.write(0, 2, "", locationFormat)
-        worksheet.write(0, 3, "", locationFormat)
-        worksheet.write(0, 4, "", locationFormat)
+        worksheet.write(0, 0, f"{sortedSchedule.iloc[0][6]}", styles["location"])
+        worksheet.write(0, 1, "", styles["location"])
+        worksheet.write(0, 2, "", styles["location"])
+        worksheet.write(0, 3, "", styles["location"])
+        worksheet.write(0, 4, "", styles["location"])
 
         worksheet.write(
             0,
@@ -1477,7 +3668,7 @@ class Ui_mainWindow(object):
                 f"Report generated as of {dateList[0].strftime('%A')}, "
                 f"{dateList[0].strftime('%B %d, %Y').replace(' 0', ' ')}"
             ),
-            genFormat,
+            styles["generated"],
         )
         for col_num, value in enumerate(
             [
@@ -1493,205 +3684,23 @@ class Ui_mainWindow(object):
                 "Notes",
             ]
         ):
-            worksheet.write(1, col_num, value, headerFormat)
+            worksheet.write(1, col_num, value, styles["header"])
         excelRow = 2
-
-        # Loop through each day
-        for i in range(0, len(dateList)):
-            singleDaySched = sortedSchedule.loc[
-                sortedSchedule["Date"].dt.date == dateList[i], :
-            ]
-
-            daytimeBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("00:00", "17:00", inclusive="left")
-                .reset_index()
-            )
-            eveningBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("17:00", "00:00", inclusive="left")
-                .reset_index()
-            )
-
-            daytimeBlock["Start Time"] = daytimeBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            daytimeBlock["End Time"] = daytimeBlock["End Time"].dt.strftime("%I:%M %p")
-            eveningBlock["Start Time"] = eveningBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            eveningBlock["End Time"] = eveningBlock["End Time"].dt.strftime("%I:%M %p")
-
-            worksheet.write(
-                excelRow,
-                0,
-                (
-                    f"{dateList[i].strftime('%A')}, "
-                    f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                ),
-                daySeparator,
-            )
-            worksheet.write_number(excelRow, 3, len(singleDaySched.index), amFormat)
-            excelRow += 1
-            if not daytimeBlock.empty:
-                for idx, row in daytimeBlock.iterrows():
-                    worksheet.write(
-                        excelRow,
-                        0,
-                        (
-                            f"{dateList[i].strftime('%A')}, "
-                            f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                        ),
-                        bodyFormat,
-                    )
-                    if row["Room"].replace("Classroom ", "") in [
-                        "502",
-                        "510",
-                        "514",
-                        "515",
-                    ]:
-                        worksheet.write_number(
-                            excelRow,
-                            1,
-                            int(row["Room"].replace("Classroom ", "")),
-                            labFormat,
-                        )
-                    else:
-                        if (
-                            "Conference Room" in row["Room"]
-                            or "Conference Room" in row["Room"]
-                        ):
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Conference Room ", "CR"),
-                                roomFormat,
-                            )
-                        elif row["Room"].replace("Classroom ", "").isdigit():
-                            worksheet.write_number(
-                                excelRow,
-                                1,
-                                int(row["Room"].replace("Classroom ", "")),
-                                roomFormat,
-                            )
-                        else:
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Classroom ", "").lstrip("0"),
-                                roomFormat,
-                            )
-                    worksheet.write(excelRow, 2, row["Section Size"], bodyFormat)
-                    if "AM" in row["Start Time"]:
-                        worksheet.write(
-                            excelRow, 3, row["Start Time"].lstrip("0"), amFormat
-                        )
-                    else:
-                        worksheet.write(
-                            excelRow, 3, row["Start Time"].lstrip("0"), bodyFormat
-                        )
-                    if "AM" in row["End Time"]:
-                        worksheet.write(
-                            excelRow, 4, row["End Time"].lstrip("0"), amFormat
-                        )
-                    else:
-                        worksheet.write(
-                            excelRow, 4, row["End Time"].lstrip("0"), bodyFormat
-                        )
-                    if "Boot Camp" in row["Section Title"]:
-                        worksheet.write(
-                            excelRow, 5, row["Section Title"], laptopReadyFormat
-                        )
-                    else:
-                        worksheet.write(excelRow, 5, row["Section Title"], bodyFormat)
-                    if row["Instructor"] == "Instructor To Be Announced":
-                        worksheet.write(excelRow, 6, "TBA", instructorFormat)
-                    elif not pd.isnull(row["Instructor"]):
-                        worksheet.write(
-                            excelRow, 6, row["Instructor"], instructorFormat
-                        )
-                    worksheet.write(excelRow, 7, row["Section Number"], bodyFormat)
-                    worksheet.write(excelRow, 8, row["Technology"], bodyFormat)
-                    worksheet.write(excelRow, 9, row["Notes"], bodyFormat)
-                    excelRow += 1
-
-            if not eveningBlock.empty:
-                for idx, row in eveningBlock.iterrows():
-                    worksheet.write(
-                        excelRow,
-                        0,
-                        (
-                            f"{dateList[i].strftime('%A')}, "
-                            f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                        ),
-                        bodyFormat,
-                    )
-                    if row["Room"].replace("Classroom ", "") in [
-                        "502",
-                        "510",
-                        "514",
-                        "515",
-                    ]:
-                        worksheet.write_number(
-                            excelRow,
-                            1,
-                            int(row["Room"].replace("Classroom ", "")),
-                            labFormat,
-                        )
-                    else:
-                        if (
-                            "Conference Room" in row["Room"]
-                            or "Conference Room" in row["Room"]
-                        ):
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Conference Room ", "CR"),
-                                roomFormat,
-                            )
-                        elif row["Room"].replace("Classroom ", "").isdigit():
-                            worksheet.write_number(
-                                excelRow,
-                                1,
-                                int(row["Room"].replace("Classroom ", "")),
-                                roomFormat,
-                            )
-                        else:
-                            worksheet.write(
-                                excelRow,
-                                1,
-                                row["Room"].replace("Classroom ", "").lstrip("0"),
-                                roomFormat,
-                            )
-                    worksheet.write(excelRow, 2, row["Section Size"], bodyFormat)
-                    worksheet.write(
-                        excelRow, 3, row["Start Time"].lstrip("0"), bodyFormat
-                    )
-                    worksheet.write(
-                        excelRow, 4, row["End Time"].lstrip("0"), bodyFormat
-                    )
-                    if "Boot Camp" in row["Section Title"]:
-                        worksheet.write(
-                            excelRow, 5, row["Section Title"], laptopReadyFormat
-                        )
-                    else:
-                        worksheet.write(excelRow, 5, row["Section Title"], bodyFormat)
-                    if row["Instructor"] == "Instructor To Be Announced":
-                        worksheet.write(excelRow, 6, "TBA", instructorFormat)
-                    elif not pd.isnull(row["Instructor"]):
-                        worksheet.write(
-                            excelRow, 6, row["Instructor"], instructorFormat
-                        )
-                    worksheet.write(excelRow, 7, row["Section Number"], bodyFormat)
-                    worksheet.write(excelRow, 8, row["Technology"], bodyFormat)
-                    worksheet.write(excelRow, 9, row["Notes"], bodyFormat)
-                    excelRow += 1
+        # Loop through each chunk of the schedule, then each day of it
+        for sortedSchedule in itertools.chain([sortedSchedule], sortedChunks):
+            excelRow = ScheduleRows(
+                sortedSchedule,
+                self.timeBlocks(self.SFCTimeBlocks, "17:00"),
+                lambda room: room.replace("Classroom ", "")
+                in ["502", "510", "514", "515"],
+            ).write(worksheet, styles, excelRow)
 
         workbook.close()
         return fileName, dateList[0].strftime("%Y-%m-%d")
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # For the render workers of the executable.
     # os.environ["QT_AUTO_SCREEN_FACTOR"] = "1"
     app = QtWidgets.QApplication(sys.argv)
     mainWindow = QtWidgets.QWidget()
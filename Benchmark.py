@@ -0,0 +1,120 @@
+#! python3
+"""Benchmark of reading Destiny exports, on synthetic reports from FakeDestiny.
+
+Compares ReportReader with the plain pandas.read_excel call AutoSchedule used
+before, and with reloading the parsed schedule from ScheduleCache, for
+term-length reports of both centers, and checks that all return the same
+schedule.
+"""
+
+import argparse
+import datetime
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import pandas as pd
+
+from AutoSchedule import ReportCache, ReportReader, ScheduleCache, pyarrow
+from FakeDestiny import FakeDestinyHandler, reportFile, syntheticReport
+
+
+def readExcel(reportPath: str) -> pd.DataFrame:
+    # How AutoSchedule read the export before ReportReader.
+    schedule = pd.read_excel(
+        reportPath,
+        header=6,
+        skipfooter=1,
+        usecols=[1, 15, 18, 4, 6, 11, 12, 9, 17, 20, 13, 22],
+        parse_dates=[1, "Start Time", "End Time"],
+        date_format={
+            "Date": "%Y/%m/%d %H:%M:%S",
+            "Start Time": "%I:%M%p",
+            "End Time": "%I:%M%p",
+        },
+    )
+    return schedule[schedule["Approval Status"] == "Final Approval"]
+
+
+def measure(
+    read: Callable[[str], pd.DataFrame], reportPath: str, repeat: int
+) -> Tuple[pd.DataFrame, float, int]:
+    """Function to time reading a report:
+    Args:
+        read (function): Function to read the report with.
+        reportPath (str): Path of the report.
+        repeat (int): Number of reads, of which the fastest counts.
+    Returns:
+        tuple: Schedule read, fastest time in seconds, and peak memory in bytes.
+    """
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        schedule = read(reportPath)
+        seconds.append(time.perf_counter() - start)
+    tracemalloc.start()
+    read(reportPath)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return schedule, min(seconds), peak
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--days", type=int, nargs="+", default=[7, 30, 120], help="Report lengths."
+    )
+    parser.add_argument(
+        "--rows-per-day",
+        type=int,
+        default=40,
+        help="Sections per building per day.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    startDate = datetime.date(2024, 1, 8)
+    buildings = FakeDestinyHandler.buildings()
+    print(f"{'Report':<24}{'Rows':>8}{'Reader':>16}{'Seconds':>10}{'Peak MB':>10}")
+    with tempfile.TemporaryDirectory() as folder:
+        for days in args.days:
+            endDate = startDate + datetime.timedelta(days=days - 1)
+            report = syntheticReport(
+                str(startDate), str(endDate), buildings, args.rows_per_day
+            )
+            expected = None
+            for outputFormat in ["xlsx", "html"]:
+                reportPath = os.path.join(folder, f"{days} {outputFormat}.xls")
+                with open(reportPath, "wb") as output:
+                    output.write(reportFile(report, outputFormat))
+
+                readers = [("ReportReader", ReportReader.read)]
+                if pyarrow is not None:
+                    scheduleCache = ScheduleCache(os.path.join(folder, "cache"))
+                    scheduleCache.put(
+                        ReportCache.contentHash(reportPath),
+                        ReportReader.read(reportPath),
+                    )
+                    readers.append(
+                        (
+                            "ScheduleCache",
+                            lambda path: scheduleCache.get(
+                                ReportCache.contentHash(path)
+                            ),
+                        )
+                    )
+                if outputFormat != "html":  # pandas cannot read the HTML export.
+                    readers.insert(0, ("read_excel", readExcel))
+                for readerName, read in readers:
+                    schedule, seconds, peak = measure(read, reportPath, args.repeat)
+                    schedule = schedule.reset_index(drop=True)
+                    if expected is None:
+                        expected = schedule
+                    else:
+                        pd.testing.assert_frame_equal(schedule, expected)
+                    print(
+                        f"{f'{days} days {outputFormat}':<24}{len(report.index):>8}"
+                        f"{readerName:>16}{seconds:>10.3f}{peak / (1 << 20):>10.1f}"
+                    )
@@ -0,0 +1,349 @@
+#! python3
+"""Local stand-in for Destiny to test and benchmark AutoSchedule offline.
+
+Serves the landing page and the Section Schedule Daily Summary form with the
+same element ids/names as Destiny, and answers report requests with synthetic
+SectionScheduleDailySummary.xls files. Point AutoSchedule at it by setting
+destinyUrl=http://localhost:8800 in config.ini. Report requests can be made
+to fail or to stall part way through the download, to exercise how
+AutoSchedule handles them.
+"""
+
+import argparse
+import datetime
+import html
+import io
+import random
+import time
+import urllib.parse
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+campuses = {
+    "Berkeley - CA0001": [
+        "UC Berkeley Extension Golden Bear Center, 1995 University Ave. - GBC",
+    ],
+    "San Francisco - CA0003": [
+        "San Francisco Campus, 160 Spear St. - SFCAMPUS",
+    ],
+}
+
+rooms = {
+    "GBC": ["Classroom 201", "Classroom 204", "Classroom 301", "Conference Room 1"],
+    "SFCAMPUS": [
+        "Classroom 502",
+        "Classroom 510",
+        "Classroom 609",
+        "Classroom 0612",
+        "Conference Room 2",
+    ],
+}
+
+titles = [
+    "Data Analytics Boot Camp",
+    "Introduction to Project Management",
+    "Financial Accounting",
+    "UX Design Fundamentals",
+    "Business Writing",
+]
+
+instructors = ["Jane Smith", "Instructor To Be Announced", "Alex Lee", None]
+
+# Every column of the export, in order from A to W.
+reportColumns = [
+    "Day",
+    "Date",
+    "Term",
+    "Type",
+    "Start Time",
+    "Duration",
+    "End Time",
+    "Course Number",
+    "Section Status",
+    "Section Number",
+    "Schedule Type",
+    "Section Title",
+    "Instructor",
+    "Building",
+    "Floor",
+    "Room",
+    "Configuration",
+    "Technology",
+    "Section Size",
+    "Room Capacity",
+    "Notes",
+    "Program",
+    "Approval Status",
+]
+
+
+def buildingReportName(building: str) -> str:
+    # "Name - CODE" as chosen in the form is reported as "CODE - Name".
+    name, code = building.rsplit(" - ", 1)
+    return f"{code} - {name}"
+
+
+def syntheticReport(
+    startDate: str, endDate: str, buildings: List[str], rowsPerDay: int, seed: int = 0
+) -> pd.DataFrame:
+    """Function to create synthetic report rows for a date range:
+    Args:
+        startDate (str): First date of the report, YYYY-MM-DD.
+        endDate (str): Last date of the report, YYYY-MM-DD.
+        buildings (list): Buildings as chosen in the report form.
+        rowsPerDay (int): Number of sections per building per day.
+        seed (int): Seed of the random generator, for repeatable reports.
+    Returns:
+        DataFrame: Report rows with every column of the export.
+    """
+    generator = random.Random(f"{seed}{startDate}{endDate}{buildings}")
+    start = datetime.date.fromisoformat(startDate)
+    end = datetime.date.fromisoformat(endDate)
+    rows = []
+    for offset in range((end - start).days + 1):
+        date = start + datetime.timedelta(days=offset)
+        for building in buildings:
+            code = building.rsplit(" - ", 1)[1]
+            for _ in range(rowsPerDay):
+                startTime = datetime.datetime.combine(
+                    date, datetime.time(generator.randrange(7, 21))
+                ) + datetime.timedelta(minutes=generator.choice([0, 15, 30, 45]))
+                endTime = startTime + datetime.timedelta(
+                    minutes=generator.choice([60, 90, 120, 180])
+                )
+                rows.append(
+                    {
+                        "Day": date.strftime("%A"),
+                        "Date": datetime.datetime.combine(date, datetime.time()),
+                        "Type": "Class",
+                        "Start Time": startTime.strftime("%I:%M%p"),
+                        "End Time": endTime.strftime("%I:%M%p"),
+                        "Section Number": (
+                            f"X{generator.randrange(100, 999)}."
+                            f"{generator.randrange(1, 9)}-"
+                            f"{generator.randrange(1, 99):03d}"
+                        ),
+                        "Section Title": generator.choice(titles),
+                        "Instructor": generator.choice(instructors),
+                        "Building": buildingReportName(building),
+                        "Room": generator.choice(rooms.get(code, ["Classroom 101"])),
+                        "Technology": generator.choice(["Projector", "", "Zoom"]),
+                        "Section Size": generator.randrange(5, 40),
+                        "Notes": generator.choice(["", "Bring laptop", ""]),
+                        "Approval Status": generator.choice(
+                            ["Final Approval"] * 9 + ["Pending"]
+                        ),
+                    }
+                )
+    return pd.DataFrame(rows, columns=reportColumns)
+
+
+def reportFile(report: pd.DataFrame, outputFormat: str = "xlsx") -> bytes:
+    """Function to lay out report rows like the Destiny XLS export:
+    Six title rows, the header row, the section rows and a footer row.
+    Args:
+        report (DataFrame): Report rows from syntheticReport.
+        outputFormat (str): "xlsx" for an Excel workbook, or "html" for an
+            HTML table saved as .xls.
+    Returns:
+        bytes: Content of SectionScheduleDailySummary.xls.
+    """
+    title = [["Section Schedule Daily Summary"]] + [[""]] * 5
+    footer = [[f"Total: {len(report.index)}"]]
+    if outputFormat == "html":
+        lines = ["<html><body><table>"]
+        report = report.assign(Date=report["Date"].dt.strftime("%Y/%m/%d %H:%M:%S"))
+        for row in title + [reportColumns] + report.fillna("").values.tolist():
+            cells = "".join(f"<td>{html.escape(str(value))}</td>" for value in row)
+            lines.append(f"<tr>{cells}</tr>")
+        lines.append(f"<tr><td>{footer[0][0]}</td></tr>")
+        lines.append("</table></body></html>")
+        return "\n".join(lines).encode("utf-8")
+
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+        worksheet = writer.book.add_worksheet("Report")
+        dateFormat = writer.book.add_format({"num_format": "yyyy/mm/dd hh:mm:ss"})
+        for rowNum, row in enumerate(title):
+            worksheet.write_row(rowNum, 0, row)
+        worksheet.write_row(6, 0, reportColumns)
+        for rowNum, row in enumerate(report.values.tolist(), start=7):
+            worksheet.write_row(
+                rowNum, 0, ["" if pd.isnull(value) else value for value in row]
+            )
+            worksheet.write_datetime(rowNum, 1, row[1], dateFormat)
+        worksheet.write_row(7 + len(report.index), 0, footer[0])
+    return buffer.getvalue()
+
+
+class FakeDestinyHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    # Share of report requests answered with a server error.
+    failRate = 0.0
+    # Seconds to stall after sending the first half of a report.
+    hang = 0.0
+    rowsPerDay = 20
+    outputFormat = "xlsx"
+    seed = 0
+    sessionId = "fake-destiny-session"
+
+    def loggedIn(self) -> bool:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return "JSESSIONID" in cookie and cookie["JSESSIONID"].value == self.sessionId
+
+    def sendPage(self, body: str, headers: Optional[Dict[str, str]] = None) -> None:
+        content = f"<html><body>{body}</body></html>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:
+        url = urllib.parse.urlparse(self.path)
+        if url.path in ["", "/"]:
+            # Logging in is instant: the landing page starts the session.
+            self.sendPage(
+                '<div id="main-area-body">Destiny One</div>',
+                {"Set-Cookie": f"JSESSIONID={self.sessionId}; Path=/"},
+            )
+        elif url.path == "/srs/reporting/sectionScheduleDailySummary.do":
+            if not self.loggedIn():
+                self.redirect("/")
+                return
+            campusOptions = "".join(
+                f'<option value="{index}">{html.escape(campus)}</option>'
+                for index, campus in enumerate(campuses, start=1)
+            )
+            buildingOptions = "".join(
+                f'<option value="{index}">{html.escape(building)}</option>'
+                for index, building in enumerate(self.buildings(), start=1)
+            )
+            self.sendPage(
+                '<form method="post" action="sectionScheduleDailySummary.do">'
+                '<input type="hidden" name="method" value="processReport">'
+                '<input type="text" id="startDateRecordString"'
+                ' name="startDateRecordString">'
+                '<input type="text" id="endDateRecordString"'
+                ' name="endDateRecordString">'
+                '<select name="scheduleBlock.campusId">'
+                f'<option value=""></option>{campusOptions}</select>'
+                '<select name="scheduleBlock.buildingId">'
+                f'<option value=""></option>{buildingOptions}</select>'
+                '<select name="outputType">'
+                '<option value="html">Output to Screen</option>'
+                '<option value="xls">Output to XLS (Export)</option></select>'
+                '<input type="submit" id="processReport" value="Generate Report">'
+                "</form>"
+            )
+        else:
+            self.send_error(404)
+
+    def do_POST(self) -> None:
+        url = urllib.parse.urlparse(self.path)
+        if url.path != "/srs/reporting/sectionScheduleDailySummary.do":
+            self.send_error(404)
+            return
+        if not self.loggedIn():
+            self.redirect("/")
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        form = urllib.parse.parse_qs(self.rfile.read(length).decode("utf-8"))
+        try:
+            startDate = self.parseDate(form["startDateRecordString"][0])
+            endDate = self.parseDate(form["endDateRecordString"][0])
+        except (KeyError, ValueError):
+            self.send_error(400, "Invalid date range")
+            return
+        buildings = self.buildings()
+        buildingId = form.get("scheduleBlock.buildingId", [""])[0]
+        if buildingId:
+            buildings = [buildings[int(buildingId) - 1]]
+
+        time.sleep(self.latency)
+        if random.random() < self.failRate:
+            self.send_error(500, "Report generation failed")
+            return
+        content = reportFile(
+            syntheticReport(startDate, endDate, buildings, self.rowsPerDay, self.seed),
+            self.outputFormat,
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "application/vnd.ms-excel")
+        self.send_header(
+            "Content-Disposition",
+            'attachment; filename="SectionScheduleDailySummary.xls"',
+        )
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.hang:
+            half = len(content) // 2
+            self.wfile.write(content[:half])
+            self.wfile.flush()
+            time.sleep(self.hang)
+            content = content[half:]
+        self.wfile.write(content)
+
+    def redirect(self, location: str) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    @staticmethod
+    def buildings() -> List[str]:
+        return [building for campus in campuses.values() for building in campus]
+
+    @staticmethod
+    def parseDate(value: str) -> str:
+        # Accept YYYY-MM-DD as typed by AutoSchedule, or Destiny's MM/DD/YYYY.
+        for dateFormat in ["%Y-%m-%d", "%m/%d/%Y"]:
+            try:
+                return str(datetime.datetime.strptime(value, dateFormat).date())
+            except ValueError:
+                continue
+        raise ValueError(value)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds to generate a report."
+    )
+    parser.add_argument(
+        "--rows-per-day",
+        type=int,
+        default=20,
+        help="Sections per building per day.",
+    )
+    parser.add_argument(
+        "--fail-rate",
+        type=float,
+        default=0.0,
+        help="Share of report requests answered with HTTP 500, 0 to 1.",
+    )
+    parser.add_argument(
+        "--hang",
+        type=float,
+        default=0.0,
+        help="Seconds to stall half way through sending each report.",
+    )
+    parser.add_argument("--format", choices=["xlsx", "html"], default="xlsx")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    FakeDestinyHandler.latency = args.latency
+    FakeDestinyHandler.failRate = args.fail_rate
+    FakeDestinyHandler.hang = args.hang
+    FakeDestinyHandler.rowsPerDay = args.rows_per_day
+    FakeDestinyHandler.outputFormat = args.format
+    FakeDestinyHandler.seed = args.seed
+    server = ThreadingHTTPServer(("localhost", args.port), FakeDestinyHandler)
+    print(f"Fake Destiny listening on http://localhost:{args.port}")
+    server.serve_forever()
@@ -0,0 +1,161 @@
+import io
+import os
+import threading
+from http.server import ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+import requests
+
+import FakeDestiny
+from AutoSchedule import (
+    ReportReader,
+    RunWorkspace,
+    ScheduleCache,
+    ScheduleSchema,
+    Ui_mainWindow,
+)
+from FakeDestiny import FakeDestinyHandler
+
+location = "Golden Bear Center"
+
+
+@pytest.fixture
+def destinyUrl():
+    server = ThreadingHTTPServer(("localhost", 0), FakeDestinyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def window(destinyUrl, tmp_path):
+    window = Ui_mainWindow.__new__(Ui_mainWindow)
+    window.destinyUrl = destinyUrl
+    window.downloadTimeout = 10
+    window.scheduleCache = ScheduleCache(str(tmp_path / "ScheduleCache"))
+    # The form getReportForm reads back from the Destiny page.
+    window.reportForms = {
+        location: {
+            "action": f"{destinyUrl}/srs/reporting/sectionScheduleDailySummary.do",
+            "fields": [
+                ("method", "processReport"),
+                ("startDateRecordString", ""),
+                ("endDateRecordString", ""),
+                ("scheduleBlock.campusId", "1"),
+                ("scheduleBlock.buildingId", "1"),
+                ("outputType", "xls"),
+            ],
+            "startDate": "startDateRecordString",
+            "endDate": "endDateRecordString",
+        }
+    }
+    return window
+
+
+class Browser(object):
+    # The parts of a logged in Chrome webdriver that createHttpSession uses.
+    def execute_script(self, script):
+        return "Mozilla/5.0"
+
+    def get_cookies(self):
+        return [{"name": "JSESSIONID", "value": FakeDestinyHandler.sessionId}]
+
+
+def expected(startDate, endDate):
+    # Sections of the report the fake answers with for the date range.
+    report = FakeDestiny.syntheticReport(
+        startDate,
+        endDate,
+        [FakeDestiny.campuses["Berkeley - CA0001"][0]],
+        FakeDestinyHandler.rowsPerDay,
+        FakeDestinyHandler.seed,
+    )
+    sections = pd.read_excel(
+        io.BytesIO(FakeDestiny.reportFile(report)),
+        header=ReportReader.header,
+        skipfooter=1,
+        usecols=ReportReader.columns,
+        parse_dates=[1, "Start Time", "End Time"],
+        date_format=ReportReader.dateFormats,
+    )
+    return sections[sections["Approval Status"] == "Final Approval"]
+
+
+def fetch(window, tmp_path, session=None):
+    reportPath = str(tmp_path / "SectionScheduleDailySummary.xls")
+    session = session or window.createHttpSession(Browser())
+    window.fetchReport(
+        session, window.reportForms[location], "2024-03-01", "2024-03-07", reportPath
+    )
+    return reportPath
+
+
+def test_fetchReport(window, tmp_path):
+    reportPath = fetch(window, tmp_path)
+    pd.testing.assert_frame_equal(
+        ReportReader.read(reportPath),
+        expected("2024-03-01", "2024-03-07").reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_fetchReportWithExpiredSession(window, tmp_path):
+    # Destiny sends the login page instead of the report.
+    with pytest.raises(requests.RequestException):
+        fetch(window, tmp_path, requests.Session())
+    assert not os.path.exists(tmp_path / "SectionScheduleDailySummary.xls")
+
+
+def test_fetchReportServerError(window, tmp_path, monkeypatch):
+    monkeypatch.setattr(FakeDestinyHandler, "failRate", 1.0)
+    with pytest.raises(requests.RequestException):
+        fetch(window, tmp_path)
+    assert not os.path.exists(tmp_path / "SectionScheduleDailySummary.xls")
+
+
+def test_fetchReportHang(window, tmp_path, monkeypatch):
+    # The download stalls half way, for longer than downloadTimeout.
+    monkeypatch.setattr(FakeDestinyHandler, "hang", 3.0)
+    window.downloadTimeout = 0.5
+    with pytest.raises(requests.RequestException):
+        fetch(window, tmp_path)
+    assert not os.path.exists(tmp_path / "SectionScheduleDailySummary.xls")
+
+
+def test_downloadReportsDirectSplitAndMerge(window):
+    window.splitReportDays = 3
+    window.maxParallelReports = 2
+    window.incrementalRefresh = False
+    reportList = {
+        f"GBC {chunkStart}": (location, chunkStart, chunkEnd)
+        for chunkStart, chunkEnd in window.splitDateRange("2024-03-01", "2024-03-10")
+    }
+    assert len(reportList) == 4
+
+    with RunWorkspace() as workspace:
+        reportPath = window.downloadReportsDirect(Browser(), workspace, reportList)
+        chunks = {
+            (chunkStart, chunkEnd): window.readReport(
+                reportPath[name], chunkStart, chunkEnd
+            )
+            for name, (_, chunkStart, chunkEnd) in reportList.items()
+        }
+    schedule = window.mergeScheduleState(
+        location, {}, chunks, "2024-03-01", "2024-03-10"
+    )
+
+    merged = ScheduleSchema.compact(
+        pd.concat(
+            [
+                expected(chunkStart, chunkEnd)
+                for _, chunkStart, chunkEnd in reportList.values()
+            ],
+            ignore_index=True,
+        )
+    )
+    pd.testing.assert_frame_equal(
+        schedule, merged, check_dtype=False, check_categorical=False
+    )
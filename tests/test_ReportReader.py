@@ -0,0 +1,77 @@
+import datetime
+
+import pandas as pd
+import pytest
+import xlsxwriter
+
+import FakeDestiny
+from AutoSchedule import ReportReader, python_calamine
+
+calamine = pytest.mark.skipif(python_calamine is None, reason="needs calamine")
+
+
+def writeReport(path, report):
+    with open(path, "wb") as output:
+        output.write(FakeDestiny.reportFile(report, "xlsx"))
+
+
+@calamine
+def test_emptyWorkbookHasNoSections(tmp_path):
+    reportPath = str(tmp_path / "SectionScheduleDailySummary.xls")
+    workbook = xlsxwriter.Workbook(reportPath)
+    workbook.add_worksheet()
+    workbook.close()
+
+    schedule = ReportReader.read(reportPath)
+    assert schedule.empty
+    assert list(schedule.columns) == ReportReader.names
+    assert list(ReportReader.readChunks(reportPath, 1)) == []
+    assert not ReportReader.isReport(reportPath)
+
+
+@calamine
+def test_readMatchesPandas(tmp_path):
+    reportPath = str(tmp_path / "SectionScheduleDailySummary.xls")
+    building = FakeDestiny.campuses["Berkeley - CA0001"][0]
+    writeReport(
+        reportPath,
+        FakeDestiny.syntheticReport("2024-03-01", "2024-03-07", [building], 20, 1),
+    )
+
+    pd.testing.assert_frame_equal(
+        ReportReader.read(reportPath),
+        ReportReader.readWithPandas(reportPath).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+@calamine
+def test_readWorkbookStartingPastColumnA(tmp_path):
+    reportPath = str(tmp_path / "SectionScheduleDailySummary.xls")
+    building = FakeDestiny.campuses["Berkeley - CA0001"][0]
+    writeReport(
+        reportPath,
+        FakeDestiny.syntheticReport("2024-03-01", "2024-03-03", [building], 10, 2),
+    )
+    expected = ReportReader.read(reportPath)
+
+    # The same export with nothing in column A, and the footer in column B.
+    with open(reportPath, "rb") as report:
+        rows = (
+            python_calamine.CalamineWorkbook.from_filelike(report)
+            .get_sheet_by_index(0)
+            .to_python(skip_empty_area=False)
+        )
+    workbook = xlsxwriter.Workbook(reportPath)
+    worksheet = workbook.add_worksheet()
+    dateFormat = workbook.add_format({"num_format": "yyyy/mm/dd hh:mm:ss"})
+    for rowNum, row in enumerate(rows):
+        for column, value in enumerate(row[1:], start=1):
+            if isinstance(value, datetime.date):
+                worksheet.write_datetime(rowNum, column, value, dateFormat)
+            elif value != "":
+                worksheet.write(rowNum, column, value)
+    worksheet.write(len(rows) - 1, 1, rows[-1][0])
+    workbook.close()
+
+    pd.testing.assert_frame_equal(ReportReader.read(reportPath), expected)
@@ -0,0 +1,58 @@
+import io
+
+import pandas as pd
+import xlsxwriter
+
+from AutoSchedule import ScheduleRows, ScheduleSchema, ScheduleStyles
+
+
+class Worksheet(object):
+    # Records the rows written, like an xlsxwriter worksheet.
+    def __init__(self):
+        self.rows = {}
+
+    def write(self, row, column, value, style=None):
+        self.rows.setdefault(row, {})[column] = value
+
+    def write_number(self, row, column, value, style=None):
+        self.write(row, column, value)
+
+    def write_row(self, row, column, values, style=None):
+        for offset, value in enumerate(values):
+            self.write(row, column + offset, value)
+
+
+def test_sectionsWithoutStartTimeAreWritten():
+    schedule = ScheduleSchema.compact(
+        pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2024-03-01"] * 3 + ["2024-03-02"]),
+                "Start Time": pd.to_datetime(
+                    ["09:00AM", None, "06:00PM", "10:00AM"], format="%I:%M%p"
+                ),
+                "End Time": pd.to_datetime(
+                    ["10:00AM", None, "08:00PM", "11:00AM"], format="%I:%M%p"
+                ),
+                "Section Number": ["X1", "X2", "X3", "X4"],
+                "Section Title": ["A", "B", "C", "D"],
+                "Instructor": ["Jane Smith"] * 4,
+                "Building": ["GBC"] * 4,
+                "Room": ["Classroom 204"] * 4,
+                "Technology": [""] * 4,
+                "Section Size": [10] * 4,
+                "Notes": [""] * 4,
+                "Approval Status": ["Final Approval"] * 4,
+            }
+        )
+    )
+    worksheet = Worksheet()
+    excelRow = ScheduleRows(schedule, [720, 1020], lambda room: False).write(
+        worksheet, ScheduleStyles(xlsxwriter.Workbook(io.BytesIO())), 0
+    )
+
+    assert excelRow == 6
+    # The day header counts three sections, and all three are listed.
+    assert worksheet.rows[0][3] == 3
+    assert [worksheet.rows[row][7] for row in range(1, 4)] == ["X1", "X2", "X3"]
+    assert worksheet.rows[2][3] == ""
+    assert worksheet.rows[4][3] == 1
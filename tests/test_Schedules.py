@@ -0,0 +1,84 @@
+import os
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import FakeDestiny
+from AutoSchedule import ReportReader, Ui_mainWindow
+
+dataPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+centers = {
+    "GBC": FakeDestiny.campuses["Berkeley - CA0001"][0],
+    "SFC": FakeDestiny.campuses["San Francisco - CA0003"][0],
+}
+
+
+def schedule(folder, location):
+    """Function to read a week of synthetic sections, with edge cases added:
+    Args:
+        folder (str): Folder to write the report to.
+        location (str): Center code, GBC or SFC.
+    Returns:
+        DataFrame: Sections of the report, as ReportReader reads them.
+    """
+    reportPath = os.path.join(folder, "SectionScheduleDailySummary.xls")
+    with open(reportPath, "wb") as output:
+        output.write(
+            FakeDestiny.reportFile(
+                FakeDestiny.syntheticReport(
+                    "2024-03-01", "2024-03-07", [centers[location]], 15, 2
+                )
+            )
+        )
+    sections = ReportReader.read(reportPath)
+
+    # Rooms, times at the block edges, and instructors the renderers shorten.
+    extra = sections.iloc[:6].copy()
+    extra["Room"] = [
+        "Online",
+        "Classroom 0612",
+        "Conference Room 2",
+        "Classroom 201",
+        "Classroom 502",
+        "Lab A",
+    ]
+    extra["Start Time"] = pd.to_datetime(
+        [f"1900-01-01 {time}" for time in ["12:00", "17:00", "11:59", "00:00"]]
+        + ["1900-01-01 23:30", "1900-01-01 08:00"]
+    )
+    extra["Instructor"] = [np.nan, "Instructor To Be Announced", "A", np.nan, "B", "C"]
+    extra["Section Title"] = ["X Boot Camp", "Y", "Z", "Boot Camp", "W", "V"]
+    sections = pd.concat([sections, extra], ignore_index=True)
+    sections.loc[len(sections) - 1, "Section Size"] = np.nan
+    sections.loc[len(sections) - 2, "Room"] = np.nan
+    return sections
+
+
+def members(workbookPath):
+    # Parts of an xlsx file, without the creation time in docProps/core.xml.
+    with zipfile.ZipFile(workbookPath) as workbook:
+        return {
+            name: workbook.read(name)
+            for name in workbook.namelist()
+            if name != "docProps/core.xml"
+        }
+
+
+@pytest.mark.parametrize("location", ["GBC", "SFC"])
+def test_scheduleMatchesReference(tmp_path, location):
+    # The reference workbooks were created by the renderers before ScheduleRows.
+    renderer = Ui_mainWindow.__new__(Ui_mainWindow)
+    renderer.saveReportToPath = str(tmp_path)
+    renderer.workbookBuffers = {}
+    sections = schedule(str(tmp_path), location)
+    if location == "SFC":
+        fileName, date = renderer.SFCSchedule(sections, location)
+    else:
+        fileName, date = renderer.GBCSchedule(sections, location)
+
+    assert date == "2024-03-01"
+    assert members(f"{tmp_path}\\{fileName}") == members(
+        os.path.join(dataPath, fileName)
+    )